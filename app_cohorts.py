@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Cohort-focused Streamlit app for chess game analysis."""
 
+import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
@@ -27,6 +28,22 @@ def get_metric_registry():
     return get_registry()
 
 
+@st.cache_data
+def _load_cohort_results_cached(cohort_id: str, mtime: float):
+    """Load cohort results, cached until the file on disk changes."""
+    return get_cohort_manager().pipeline.load_cohort_results(cohort_id)
+
+
+def load_cohort_results(cohort_id: str):
+    """Load cohort results with mtime-keyed caching across reruns."""
+    pipeline = get_cohort_manager().pipeline
+    result_path = pipeline.pkl_path(cohort_id)
+    if not result_path.exists():
+        result_path = pipeline.json_path(cohort_id)
+    mtime = result_path.stat().st_mtime if result_path.exists() else 0.0
+    return _load_cohort_results_cached(cohort_id, mtime)
+
+
 # Main app
 def main():
     st.title("♟️ Pawn Blockers - Cohort Analysis")
@@ -47,19 +64,15 @@ def main():
         st.error("No cohorts available. Run `python scripts/manage_cohorts.py process` to create cohorts.")
         return
 
-    # Cohort selection with defaults
-    default_cohort1 = None
-    default_cohort2 = None
+    # O(1) lookups instead of linear scans per rerun
+    id_to_display = {v: k for k, v in cohort_options.items()}
+    options_list = list(cohort_options.keys())
+    display_to_idx = {d: i for i, d in enumerate(options_list)}
 
-    # Set defaults if we have the expected cohorts
-    cohort_ids = list(cohort_options.values())
-    if "leela_odds" in cohort_ids:
-        default_cohort1 = next(k for k, v in cohort_options.items() if v == "leela_odds")
-    if "twic_strong" in cohort_ids:
-        default_cohort2 = next(k for k, v in cohort_options.items() if v == "twic_strong")
+    # Set defaults if we have the expected cohorts, else first two available
+    default_cohort1 = id_to_display.get("leela_odds")
+    default_cohort2 = id_to_display.get("twic_strong")
 
-    # If we don't have defaults, use first two available
-    options_list = list(cohort_options.keys())
     if not default_cohort1 and options_list:
         default_cohort1 = options_list[0]
     if not default_cohort2 and len(options_list) > 1:
@@ -69,18 +82,14 @@ def main():
 
     cohort1_display = st.sidebar.selectbox(
         "Cohort A",
-        options=list(cohort_options.keys()),
-        index=options_list.index(default_cohort1) if default_cohort1 in options_list else 0,
+        options=options_list,
+        index=display_to_idx.get(default_cohort1, 0),
         key="cohort1",
     )
     cohort2_display = st.sidebar.selectbox(
         "Cohort B",
-        options=list(cohort_options.keys()),
-        index=(
-            options_list.index(default_cohort2)
-            if default_cohort2 in options_list
-            else 1 if len(options_list) > 1 else 0
-        ),
+        options=options_list,
+        index=display_to_idx.get(default_cohort2, 1 if len(options_list) > 1 else 0),
         key="cohort2",
     )
 
@@ -104,8 +113,8 @@ def main():
 
     # Load cohort data
     with st.spinner("Loading cohort data..."):
-        cohort1_data = cohort_manager.pipeline.load_cohort_results(cohort1_id)
-        cohort2_data = cohort_manager.pipeline.load_cohort_results(cohort2_id)
+        cohort1_data = load_cohort_results(cohort1_id)
+        cohort2_data = load_cohort_results(cohort2_id)
 
     if cohort1_data is None or cohort1_data.empty:
         st.error(f"No data found for cohort '{cohort1_id}'. Process it first with the management script.")
@@ -121,13 +130,13 @@ def main():
     with col1:
         st.subheader(f"🅰️ {cohort1_display}")
         st.metric("Games", len(cohort1_data))
-        players1 = len(set(cohort1_data["white_player"]) | set(cohort1_data["black_player"]))
+        players1 = pd.concat([cohort1_data["white_player"], cohort1_data["black_player"]], ignore_index=True).nunique()
         st.metric("Players", players1)
 
     with col2:
         st.subheader(f"🅱️ {cohort2_display}")
         st.metric("Games", len(cohort2_data))
-        players2 = len(set(cohort2_data["white_player"]) | set(cohort2_data["black_player"]))
+        players2 = pd.concat([cohort2_data["white_player"], cohort2_data["black_player"]], ignore_index=True).nunique()
         st.metric("Players", players2)
 
     # Run comparison
@@ -160,7 +169,7 @@ def main():
     st.markdown("### 📈 Distributions")
 
     # Box plot comparison
-    if result.cohort1_values and result.cohort2_values:
+    if len(result.cohort1_values) and len(result.cohort2_values):
         fig = comparison_boxplot(
             result.cohort1_values, result.cohort2_values, cohort1_id, cohort2_id, f"{metric.display_name} Comparison"
         )
@@ -173,10 +182,12 @@ def main():
         per_file_data = result.visualization_data["per_file_data"]
 
         if cohort1_id in per_file_data and cohort2_id in per_file_data:
-            # Calculate shared scale
-            all_values = list(per_file_data[cohort1_id].values()) + list(per_file_data[cohort2_id].values())
+            # Calculate shared scale without materializing intermediate lists
             vmin = 0.0
-            vmax = max(all_values) if all_values else 1.0
+            vmax = max(
+                max(per_file_data[cohort1_id].values(), default=0.0),
+                max(per_file_data[cohort2_id].values(), default=0.0),
+            ) or 1.0
 
             col1, col2 = st.columns(2)
 
@@ -184,13 +195,14 @@ def main():
                 fig1 = create_simple_board_heatmap(
                     per_file_data[cohort1_id], f"{cohort1_id} - {metric.display_name}", vmin=vmin, vmax=vmax
                 )
-                st.plotly_chart(fig1, use_container_width=True)
+                # Static render: skips Plotly's interaction JS for these small boards
+                st.plotly_chart(fig1, use_container_width=True, config={"staticPlot": True})
 
             with col2:
                 fig2 = create_simple_board_heatmap(
                     per_file_data[cohort2_id], f"{cohort2_id} - {metric.display_name}", vmin=vmin, vmax=vmax
                 )
-                st.plotly_chart(fig2, use_container_width=True)
+                st.plotly_chart(fig2, use_container_width=True, config={"staticPlot": True})
 
             st.caption(f"📏 Shared scale: {vmin:.3f} to {vmax:.3f}")
 
@@ -207,35 +219,20 @@ def main():
 
     # Statistical details
     with st.expander("📋 Statistical Details"):
-        # Use metrics instead of dataframe to avoid PyArrow issues
         st.write("**Statistical Summary:**")
+        st.caption(f"Count: {len(result.cohort1_values)} vs {len(result.cohort2_values)}")
 
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.metric("Count", f"{len(result.cohort1_values)} vs {len(result.cohort2_values)}")
-
-        with col2:
-            st.metric(
-                "Mean", f"{result.summary_stats['cohort1_mean']:.3f} vs {result.summary_stats['cohort2_mean']:.3f}"
-            )
-
-        with col3:
-            st.metric("Effect Size", f"{result.summary_stats.get('effect_size', 0):.3f}")
-
-        # Additional stats in a second row
-        col4, col5, col6 = st.columns(3)
-
-        with col4:
-            st.metric(
-                "Median",
-                f"{result.summary_stats['cohort1_median']:.3f} vs {result.summary_stats['cohort2_median']:.3f}",
-            )
-
-        with col5:
-            st.metric(
-                "Std Dev", f"{result.summary_stats['cohort1_std']:.3f} vs {result.summary_stats['cohort2_std']:.3f}"
-            )
+        # Keep the frame numeric (floats serialize cleanly) and format at display time
+        stats = result.summary_stats
+        stats_df = pd.DataFrame(
+            {
+                cohort1_id: [stats["cohort1_mean"], stats["cohort1_median"], stats["cohort1_std"]],
+                cohort2_id: [stats["cohort2_mean"], stats["cohort2_median"], stats["cohort2_std"]],
+            },
+            index=["Mean", "Median", "Std Dev"],
+        )
+        st.dataframe(stats_df.style.format("{:.3f}"), use_container_width=True)
+        st.metric("Effect Size (Cohen's d)", f"{stats.get('effect_size', 0):.3f}")
 
     # Cohort management link
     st.markdown("---")
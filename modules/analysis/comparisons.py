@@ -1,15 +1,72 @@
 """Statistical comparisons between groups"""
 
-from collections import defaultdict
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from ..core._pgn_cache import build_positions
+from ..core.board_analysis import FILES
 from ..core.metrics import calculate_spbts_for_game
 from ..data.game_parser import extract_game_metadata, parse_player_names
 from .grouping import GameFilter, GameInfo, PlayerClassifier
 
+# Below this many games, process pool startup costs more than it saves
+_PARALLEL_THRESHOLD = 50
+
+# Anything that looks like PGN starts with at least one header tag
+_PGN_HEADER_RE = re.compile(r"^\s*\[\w+ ")
+
+
+def _compute_spbts(pgn: str, max_plies: int) -> Optional[Tuple[Dict, int]]:
+    """
+    Pure per-game worker: compute SPBTS summary and plies analyzed.
+
+    Module-level so it can be pickled for process pools. Returns None
+    for games that fail to parse.
+    """
+    try:
+        # Bulk path only needs the summary; skip the per-ply trace frame
+        summary, _ = calculate_spbts_for_game(pgn, max_plies, include_trace=False)
+        positions = build_positions(pgn, max_plies)  # cached by the call above
+        return summary, len(positions) - 1
+    except Exception:
+        return None
+
+
+def _median_and_mean(values: List[float]) -> Tuple[float, float]:
+    """Median and mean from one sort instead of separate median/mean passes."""
+    arr = np.sort(np.asarray(values, dtype=float))
+    n = arr.size
+    if n % 2:
+        median = float(arr[n // 2])
+    else:
+        median = float(0.5 * (arr[n // 2 - 1] + arr[n // 2]))
+    return median, float(arr.mean())
+
+
+def _per_file_array(per_file: Optional[Dict[str, Optional[float]]]) -> np.ndarray:
+    """Convert a per-file rate dict into a fixed-order float32 array (NaN for missing)."""
+    if not per_file:
+        return np.full(8, np.nan, dtype=np.float32)
+    return np.array([np.nan if per_file.get(f) is None else per_file[f] for f in FILES], dtype=np.float32)
+
+
+def _map_spbts(pgn_games: List[str], max_plies: int) -> List[Optional[Tuple[Dict, int]]]:
+    """Run SPBTS calculation over games, in parallel when worthwhile."""
+    n_workers = os.cpu_count() or 1
+    if len(pgn_games) < _PARALLEL_THRESHOLD or n_workers == 1:
+        return [_compute_spbts(pgn, max_plies) for pgn in pgn_games]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        chunksize = max(1, len(pgn_games) // (n_workers * 4))
+        return list(pool.map(_compute_spbts, pgn_games, [max_plies] * len(pgn_games), chunksize=chunksize))
+
 
 def analyze_game_collection(
     pgn_games: List[str],
@@ -31,11 +88,16 @@ def analyze_game_collection(
     Returns:
         DataFrame with game analysis results and classifications
     """
-    results = []
-
+    # Parse and filter first (cheap string work), keeping classifier/filter
+    # closures in this process — only the CPU-bound SPBTS step is farmed out
+    candidates = []
     for pgn in pgn_games:
+        # Cheap upfront sniff: skip obviously-not-PGN input without
+        # paying for a parse attempt and exception traceback
+        if not pgn or not _PGN_HEADER_RE.match(pgn[:256]):
+            continue
+
         try:
-            # Parse game metadata
             white, black, headers = parse_player_names(pgn)
             metadata = extract_game_metadata(headers)
 
@@ -49,69 +111,88 @@ def analyze_game_collection(
                 metadata=metadata,
             )
 
-            # Apply filters
             if game_filter and not game_filter.passes(game_info):
                 continue
 
-            # Calculate SPBTS metrics
-            summary, trace = calculate_spbts_for_game(pgn, max_plies)
+            candidates.append((pgn, white, black, metadata, game_info))
+        except (ValueError, KeyError, TypeError, AttributeError, IndexError):
+            # Skip malformed games; anything else is a real bug and should surface
+            continue
 
-            # Skip games with insufficient exposure
-            white_exp = summary["white"]["exposure"]
-            black_exp = summary["black"]["exposure"]
-            if white_exp < min_exposure or black_exp < min_exposure:
-                continue
+    # Calculate SPBTS metrics (parallel across cores for large collections)
+    spbts_results = _map_spbts([c[0] for c in candidates], max_plies)
 
-            # Classify game
-            groups = classifier.classify_game(game_info)
-
-            # Determine which side is which group (for paired analysis)
-            white_groups = []
-            black_groups = []
-
-            for group in groups:
-                # Simple heuristic: if group name appears in player name, assign to that side
-                if any(term in white.lower() for term in group.split("_")):
-                    white_groups.append(group)
-                elif any(term in black.lower() for term in group.split("_")):
-                    black_groups.append(group)
-
-            # Build result record
-            plies_analyzed = int(trace["ply_index"].max()) if not trace.empty else 0
-
-            # Extract per-file rates
-            white_per_file = summary["white"].get("per_file_friendlyNP", {})
-            black_per_file = summary["black"].get("per_file_friendlyNP", {})
-
-            result = {
-                "game_id": metadata["game_id"],
-                "white_player": white,
-                "black_player": black,
-                "white_groups": white_groups,
-                "black_groups": black_groups,
-                "all_groups": groups,
-                "white_spbts": summary["white"]["SPBTS_friendlyNP"],
-                "black_spbts": summary["black"]["SPBTS_friendlyNP"],
-                "white_exposure": white_exp,
-                "black_exposure": black_exp,
-                "plies_analyzed": plies_analyzed,
-                "white_f_pawn_fates": summary["white"]["f_pawn_fates"],
-                "black_f_pawn_fates": summary["black"]["f_pawn_fates"],
-                **metadata,
-            }
-
-            # Add per-file rates
-            for file_letter in "abcdefgh":
-                result[f"white_{file_letter}"] = white_per_file.get(file_letter)
-                result[f"black_{file_letter}"] = black_per_file.get(file_letter)
-
-            results.append(result)
-
-        except Exception:
-            # Skip problematic games
+    results = []
+    white_files = []
+    black_files = []
+    for (pgn, white, black, metadata, game_info), spbts in zip(candidates, spbts_results):
+        if spbts is None:
+            continue
+        summary, plies_analyzed = spbts
+
+        # Skip games with insufficient exposure
+        white_exp = summary["white"]["exposure"]
+        black_exp = summary["black"]["exposure"]
+        if white_exp < min_exposure or black_exp < min_exposure:
             continue
 
-    return pd.DataFrame(results)
+        # Classify game
+        groups = classifier.classify_game(game_info)
+
+        # Determine which side is which group (for paired analysis)
+        white_groups = []
+        black_groups = []
+        white_lower = game_info.white_lower
+        black_lower = game_info.black_lower
+
+        for group in groups:
+            # Simple heuristic: if group name appears in player name, assign to that side
+            terms = group.split("_")
+            if any(term in white_lower for term in terms):
+                white_groups.append(group)
+            elif any(term in black_lower for term in terms):
+                black_groups.append(group)
+
+        # Per-file rates go into fixed-order float32 rows, not 16 dict lookups
+        white_files.append(_per_file_array(summary["white"].get("per_file_friendlyNP")))
+        black_files.append(_per_file_array(summary["black"].get("per_file_friendlyNP")))
+
+        result = {
+            "game_id": metadata["game_id"],
+            "white_player": white,
+            "black_player": black,
+            "white_groups": white_groups,
+            "black_groups": black_groups,
+            "all_groups": groups,
+            "white_spbts": summary["white"]["SPBTS_friendlyNP"],
+            "black_spbts": summary["black"]["SPBTS_friendlyNP"],
+            "white_exposure": white_exp,
+            "black_exposure": black_exp,
+            "plies_analyzed": plies_analyzed,
+            "white_f_pawn_fates": summary["white"]["f_pawn_fates"],
+            "black_f_pawn_fates": summary["black"]["f_pawn_fates"],
+            **metadata,
+        }
+
+        results.append(result)
+
+    df = pd.DataFrame(results)
+
+    # Fan the per-file matrices out into contiguous float32 columns
+    if results:
+        white_arr = np.vstack(white_files)
+        black_arr = np.vstack(black_files)
+        for i, file_letter in enumerate(FILES):
+            df[f"white_{file_letter}"] = white_arr[:, i]
+            df[f"black_{file_letter}"] = black_arr[:, i]
+
+        # Low-cardinality string columns: categorical codes shrink memory and
+        # speed up downstream groupby/nunique
+        for col in ("white_player", "black_player", "variant", "time_control", "result"):
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
+    return df
 
 
 def compare_groups(
@@ -146,8 +227,14 @@ def compare_groups(
             return {"error": f"Insufficient data for comparison between {group1_name} and {group2_name}"}
 
         # For cohort comparison, use all SPBTS values from each cohort
-        group1_values = pd.concat([group1_df["white_spbts"], group1_df["black_spbts"]]).dropna().tolist()
-        group2_values = pd.concat([group2_df["white_spbts"], group2_df["black_spbts"]]).dropna().tolist()
+        def _both_sides(cohort_df: pd.DataFrame) -> List[float]:
+            values = np.concatenate(
+                [cohort_df["white_spbts"].to_numpy(dtype=float), cohort_df["black_spbts"].to_numpy(dtype=float)]
+            )
+            return values[~np.isnan(values)].tolist()
+
+        group1_values = _both_sides(group1_df)
+        group2_values = _both_sides(group2_df)
 
         results = {
             "group1": group1_name,
@@ -159,44 +246,41 @@ def compare_groups(
         }
 
     else:
-        # Original paired comparison logic for within-game groups
-        mask = df[group_col].apply(lambda x: group1_name in x and group2_name in x)
-        comparison_df = df[mask].copy()
+        # Original paired comparison logic for within-game groups,
+        # vectorized: one membership pass, then np.where for side assignment
+        has_both = df[group_col].apply(lambda x: group1_name in x and group2_name in x)
+        comparison_df = df[has_both]
 
         if comparison_df.empty:
             return {"error": f"No games found with both {group1_name} and {group2_name}"}
 
         results = {"group1": group1_name, "group2": group2_name, "n_games": len(comparison_df), "metrics": {}}
 
-        # For each game, determine which side is which group
-        group1_values = []
-        group2_values = []
+        # Determine which side is which group per game
+        group1_is_white = comparison_df["white_groups"].apply(lambda groups: group1_name in groups).to_numpy()
 
-        for _, row in comparison_df.iterrows():
-            # Determine side assignment based on groups
-            if group1_name in row["white_groups"]:
-                group1_side, group2_side = "white", "black"
-            else:
-                group1_side, group2_side = "black", "white"
+        white_spbts = comparison_df["white_spbts"].to_numpy(dtype=float)
+        black_spbts = comparison_df["black_spbts"].to_numpy(dtype=float)
 
-            group1_spbts = row[f"{group1_side}_spbts"]
-            group2_spbts = row[f"{group2_side}_spbts"]
+        group1_arr = np.where(group1_is_white, white_spbts, black_spbts)
+        group2_arr = np.where(group1_is_white, black_spbts, white_spbts)
 
-            if group1_spbts is not None and group2_spbts is not None:
-                group1_values.append(group1_spbts)
-                group2_values.append(group2_spbts)
+        # Keep only games where both sides have values
+        valid = ~(np.isnan(group1_arr) | np.isnan(group2_arr))
+        group1_values = group1_arr[valid].tolist()
+        group2_values = group2_arr[valid].tolist()
 
     # Calculate comparison statistics
     if group1_values and group2_values:
-        group1_arr = np.array(group1_values)
-        group2_arr = np.array(group2_values)
+        group1_median, group1_mean = _median_and_mean(group1_values)
+        group2_median, group2_mean = _median_and_mean(group2_values)
 
         results["metrics"]["spbts"] = {
-            "group1_median": float(np.median(group1_arr)),
-            "group2_median": float(np.median(group2_arr)),
-            "group1_mean": float(np.mean(group1_arr)),
-            "group2_mean": float(np.mean(group2_arr)),
-            "difference": float(np.median(group1_arr) - np.median(group2_arr)),
+            "group1_median": group1_median,
+            "group2_median": group2_median,
+            "group1_mean": group1_mean,
+            "group2_mean": group2_mean,
+            "difference": group1_median - group2_median,
             "group1_values": group1_values,
             "group2_values": group2_values,
         }
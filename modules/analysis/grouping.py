@@ -1,6 +1,9 @@
 """Flexible player and game classification system"""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
@@ -18,12 +21,39 @@ class GameInfo:
     variant: str
     metadata: Dict[str, Any]
 
+    # Lowercased once here so every rule doesn't re-allocate per call
+    white_lower: str = field(init=False, repr=False)
+    black_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.white_lower = self.white_player.lower()
+        self.black_lower = self.black_player.lower()
+
+
+def _game_info_from_row(row: pd.Series) -> GameInfo:
+    """Build a GameInfo from one games-DataFrame row (batch fallback path)."""
+
+    def _int_or_none(value):
+        return None if pd.isna(value) else int(value)
+
+    return GameInfo(
+        white_player=row["white_player"],
+        black_player=row["black_player"],
+        white_elo=_int_or_none(row.get("white_elo")),
+        black_elo=_int_or_none(row.get("black_elo")),
+        time_control=row.get("time_control"),
+        variant=row.get("variant", "Standard"),
+        metadata={},
+    )
+
 
 class PlayerClassifier:
     """Flexible system for classifying players into groups."""
 
     def __init__(self):
         self.rules = []
+        # Stable per-rule parameter descriptions for cache fingerprinting
+        self.rule_keys = []
         self.engine_patterns = [
             "leela",
             "stockfish",
@@ -37,30 +67,47 @@ class PlayerClassifier:
             "engine",
             "computer",
         ]
-
-    def add_rule(self, name: str, classifier_func: Callable[[GameInfo], bool]) -> "PlayerClassifier":
+        # Single compiled alternation beats a Python `in` scan per pattern
+        self._engine_re = re.compile("|".join(re.escape(p) for p in self.engine_patterns))
+
+    def add_rule(
+        self,
+        name: str,
+        classifier_func: Callable[[GameInfo], bool],
+        batch_func: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+        cache_key: Optional[str] = None,
+    ) -> "PlayerClassifier":
         """
         Add a classification rule.
 
         Args:
             name: Name of the classification group
             classifier_func: Function that takes GameInfo and returns True if match
+            batch_func: Optional vectorized form taking a games DataFrame and
+                returning a boolean Series (used by classify_games)
+            cache_key: Stable description of the rule's parameters, used in
+                AnalysisPipeline's disk-cache key; custom callables fall back
+                to the name alone
 
         Returns:
             Self for method chaining
         """
-        self.rules.append((name, classifier_func))
+        self.rules.append((name, classifier_func, batch_func))
+        self.rule_keys.append(cache_key or f"custom:{name}")
         return self
 
     def add_engine_rule(self, name: str = "engine") -> "PlayerClassifier":
         """Add rule to identify chess engines."""
 
         def is_engine(game: GameInfo) -> bool:
-            white_lower = game.white_player.lower()
-            black_lower = game.black_player.lower()
-            return any(pattern in white_lower or pattern in black_lower for pattern in self.engine_patterns)
+            return bool(self._engine_re.search(game.white_lower) or self._engine_re.search(game.black_lower))
+
+        def is_engine_batch(df: pd.DataFrame) -> pd.Series:
+            white = df["white_player"].str.lower().str.contains(self._engine_re, na=False)
+            black = df["black_player"].str.lower().str.contains(self._engine_re, na=False)
+            return white | black
 
-        return self.add_rule(name, is_engine)
+        return self.add_rule(name, is_engine, is_engine_batch, cache_key=f"engine:{name}")
 
     def add_rating_rule(self, name: str, min_rating: int, max_rating: int = 9999) -> "PlayerClassifier":
         """Add rule based on rating range."""
@@ -72,16 +119,31 @@ class PlayerClassifier:
             max_rating_in_game = max(ratings)
             return min_rating <= max_rating_in_game <= max_rating
 
-        return self.add_rule(name, rating_match)
+        def rating_match_batch(df: pd.DataFrame) -> pd.Series:
+            # max skips NaN; rows with no ratings give NaN, which between()
+            # treats as no match - same as the scalar rule
+            max_elo = df[["white_elo", "black_elo"]].max(axis=1)
+            return max_elo.between(min_rating, max_rating)
+
+        return self.add_rule(
+            name, rating_match, rating_match_batch, cache_key=f"rating:{name}:{min_rating}-{max_rating}"
+        )
 
     def add_player_name_rule(self, name: str, player_names: List[str]) -> "PlayerClassifier":
         """Add rule for specific player names."""
         player_set = {p.lower() for p in player_names}
 
         def name_match(game: GameInfo) -> bool:
-            return game.white_player.lower() in player_set or game.black_player.lower() in player_set
+            return game.white_lower in player_set or game.black_lower in player_set
+
+        def name_match_batch(df: pd.DataFrame) -> pd.Series:
+            white = df["white_player"].str.lower().isin(player_set)
+            black = df["black_player"].str.lower().isin(player_set)
+            return white | black
 
-        return self.add_rule(name, name_match)
+        return self.add_rule(
+            name, name_match, name_match_batch, cache_key=f"names:{name}:" + ",".join(sorted(player_set))
+        )
 
     def classify_game(self, game: GameInfo) -> List[str]:
         """
@@ -91,17 +153,39 @@ class PlayerClassifier:
             List of group names that match this game
         """
         matches = []
-        for name, rule_func in self.rules:
+        for name, rule_func, _ in self.rules:
             if rule_func(game):
                 matches.append(name)
         return matches
 
+    def classify_games(self, games_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify many games at once.
+
+        Args:
+            games_df: DataFrame with white_player/black_player columns and,
+                for rating rules, white_elo/black_elo
+
+        Returns:
+            Boolean DataFrame with one column per rule, aligned to games_df
+        """
+        columns = {}
+        for name, rule_func, batch_func in self.rules:
+            if batch_func is not None:
+                columns[name] = batch_func(games_df)
+            else:
+                # Custom add_rule callables only know GameInfo; evaluate row-wise
+                columns[name] = games_df.apply(lambda row: rule_func(_game_info_from_row(row)), axis=1)
+        return pd.DataFrame(columns, index=games_df.index)
+
 
 class GameFilter:
     """Filter games based on various criteria."""
 
     def __init__(self):
         self.filters = []
+        # Stable per-filter parameter descriptions for cache fingerprinting
+        self.filter_keys = []
 
     def add_variant_filter(self, variants: List[str]) -> "GameFilter":
         """Filter by chess variant."""
@@ -111,6 +195,7 @@ class GameFilter:
             return game.variant.lower() in variant_set
 
         self.filters.append(variant_match)
+        self.filter_keys.append("variant:" + ",".join(sorted(variant_set)))
         return self
 
     def add_time_control_filter(self, time_controls: List[str]) -> "GameFilter":
@@ -122,6 +207,7 @@ class GameFilter:
             return any(tc in game.time_control for tc in time_controls)
 
         self.filters.append(time_match)
+        self.filter_keys.append("time:" + ",".join(time_controls))
         return self
 
     def add_rating_filter(self, min_rating: Optional[int] = None, max_rating: Optional[int] = None) -> "GameFilter":
@@ -140,11 +226,15 @@ class GameFilter:
             return True
 
         self.filters.append(rating_filter)
+        self.filter_keys.append(f"rating:{min_rating}-{max_rating}")
         return self
 
     def passes(self, game: GameInfo) -> bool:
-        """Check if game passes all filters."""
-        return all(filter_func(game) for filter_func in self.filters)
+        """Check if game passes all filters (early exit on first failure)."""
+        for filter_func in self.filters:
+            if not filter_func(game):
+                return False
+        return True
 
 
 # Predefined classifiers for common use cases
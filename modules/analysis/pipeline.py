@@ -1,5 +1,10 @@
 """End-to-end analysis pipeline"""
 
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -12,13 +17,14 @@ from .grouping import GameFilter, PlayerClassifier
 class AnalysisPipeline:
     """Flexible pipeline for chess game analysis."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = "data/analysis_cache"):
         self.games = []
         self.classifier = PlayerClassifier()
         self.game_filter = GameFilter()
         self.results_df = None
         self.max_plies = 24
         self.min_exposure = 64
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def add_games_from_lichess(
         self, username: str, max_games: int = 200, token: Optional[str] = None
@@ -29,6 +35,31 @@ class AnalysisPipeline:
         self.games.extend(user_games)
         return self
 
+    def add_games_from_lichess_batch(
+        self, usernames: List[str], max_games: int = 200, token: Optional[str] = None, max_concurrency: int = 8
+    ) -> "AnalysisPipeline":
+        """
+        Add games from several Lichess users, downloading streams concurrently.
+
+        Each user's stream is IO-bound, so a small thread pool reclaims the
+        time otherwise spent waiting on one download at a time. Concurrency
+        is capped to stay friendly to Lichess rate limits.
+        """
+        client = LichessClient(token)
+
+        def fetch(username: str) -> List[str]:
+            try:
+                return list(client.stream_user_games(username, max_games))
+            except Exception as e:
+                print(f"Failed to collect from {username}: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, max(1, len(usernames)))) as pool:
+            for user_games in pool.map(fetch, usernames):
+                self.games.extend(user_games)
+
+        return self
+
     def add_games_from_pgn_list(self, pgn_games: List[str]) -> "AnalysisPipeline":
         """Add games from list of PGN strings."""
         self.games.extend(pgn_games)
@@ -50,11 +81,39 @@ class AnalysisPipeline:
         self.min_exposure = min_exposure
         return self
 
+    def _cache_path(self) -> Optional[Path]:
+        """Cache file keyed by game content and analysis params."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for pgn in sorted(self.games):
+            digest.update(pgn.encode())
+        digest.update(f"{self.max_plies}:{self.min_exposure}".encode())
+        # Rule/filter callables can't be hashed; the recorded parameter keys
+        # are the cheap stable fingerprint (custom add_rule callables fall
+        # back to their name, so changing one in place won't invalidate)
+        digest.update("|".join(self.classifier.rule_keys).encode())
+        digest.update("|".join(self.game_filter.filter_keys).encode())
+        return self.cache_dir / f"analysis_{digest.hexdigest()}.pkl"
+
     def run_analysis(self) -> "AnalysisPipeline":
-        """Run the analysis on collected games."""
+        """Run the analysis on collected games, reusing cached results when inputs match."""
+        cache_path = self._cache_path()
+        if cache_path is not None and cache_path.exists():
+            try:
+                self.results_df = pd.read_pickle(cache_path)
+                return self
+            except Exception:
+                pass  # Corrupt cache - fall through and recompute
+
         self.results_df = analyze_game_collection(
             self.games, self.classifier, self.game_filter, self.max_plies, self.min_exposure
         )
+
+        if cache_path is not None and not self.results_df.empty:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.results_df.to_pickle(cache_path)
+
         return self
 
     def get_results(self) -> pd.DataFrame:
@@ -90,9 +149,4 @@ class AnalysisPipeline:
 
     def _get_group_distribution(self) -> Dict[str, int]:
         """Count games per group."""
-        from collections import Counter
-
-        all_groups = []
-        for groups_list in self.results_df["all_groups"]:
-            all_groups.extend(groups_list)
-        return dict(Counter(all_groups))
+        return self.results_df["all_groups"].explode().dropna().value_counts().to_dict()
@@ -1,12 +1,17 @@
 """Cohort configuration system."""
 
-from dataclasses import dataclass, field
+import pickle
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+# libyaml's C loader/dumper parse an order of magnitude faster when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class CohortType(Enum):
     """Types of cohorts based on data source."""
@@ -61,12 +66,8 @@ class CohortConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, CohortType):
-                result[key] = value.value
-            else:
-                result[key] = value
+        result = asdict(self)
+        result["type"] = self.type.value
         return result
 
 
@@ -77,39 +78,87 @@ class CohortConfigManager:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self._cohorts = {}
-        self._load_configs()
-
-    def _load_configs(self):
-        """Load all YAML config files from the config directory."""
-        self._cohorts.clear()
-
-        for yaml_file in self.config_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, "r") as f:
-                    data = yaml.safe_load(f)
-
-                # Handle multiple cohorts in one file
-                if isinstance(data, list):
-                    for cohort_data in data:
-                        cohort = CohortConfig.from_dict(cohort_data)
-                        self._cohorts[cohort.id] = cohort
-                elif isinstance(data, dict):
-                    cohort = CohortConfig.from_dict(data)
-                    self._cohorts[cohort.id] = cohort
-
-            except Exception as e:
-                print(f"Error loading {yaml_file}: {e}")
+        # Only index filenames up front; YAML is parsed on first use.
+        # iterdir with a suffix check skips glob's pattern machinery.
+        self._pending = {p.stem: p for p in self.config_dir.iterdir() if p.suffix == ".yaml"}
+
+    def _sidecar_path(self, yaml_file: Path) -> Path:
+        return self.config_dir / ".cache" / f"{yaml_file.stem}.pkl"
+
+    def _parse_file(self, yaml_file: Path):
+        """Parse one YAML file and register the cohort(s) it contains.
+
+        Parsed results are cached in a pickle sidecar keyed on the source
+        file's mtime and size, so repeat runs skip YAML tokenization.
+        """
+        try:
+            stat = yaml_file.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            sidecar = self._sidecar_path(yaml_file)
+
+            if sidecar.exists():
+                try:
+                    with open(sidecar, "rb") as f:
+                        cached_key, cohorts = pickle.load(f)
+                    if cached_key == key:
+                        for cohort in cohorts:
+                            self._cohorts[cohort.id] = cohort
+                        return
+                except Exception:
+                    pass  # Stale or corrupt sidecar - reparse below
+
+            # load_all streams ---separated documents lazily and degrades
+            # to a single document for plain files
+            cohorts = []
+            with open(yaml_file, "r") as f:
+                for data in yaml.load_all(f, Loader=_YamlLoader):
+                    # Handle multiple cohorts in one document
+                    if isinstance(data, list):
+                        cohorts.extend(CohortConfig.from_dict(cohort_data) for cohort_data in data)
+                    elif isinstance(data, dict):
+                        cohorts.append(CohortConfig.from_dict(data))
+
+            for cohort in cohorts:
+                self._cohorts[cohort.id] = cohort
+
+            if cohorts:
+                sidecar.parent.mkdir(exist_ok=True)
+                with open(sidecar, "wb") as f:
+                    pickle.dump((key, cohorts), f)
+
+        except Exception as e:
+            print(f"Error loading {yaml_file}: {e}")
+
+    def _load_all(self):
+        """Parse any config files not loaded yet."""
+        for yaml_file in self._pending.values():
+            self._parse_file(yaml_file)
+        self._pending = {}
 
     def get_cohort(self, cohort_id: str) -> Optional[CohortConfig]:
-        """Get cohort config by ID."""
+        """Get cohort config by ID, parsing only what's needed."""
+        if cohort_id in self._cohorts:
+            return self._cohorts[cohort_id]
+
+        # Common case: the file is named after the cohort id
+        yaml_file = self._pending.pop(cohort_id, None)
+        if yaml_file is not None:
+            self._parse_file(yaml_file)
+            if cohort_id in self._cohorts:
+                return self._cohorts[cohort_id]
+
+        # The id may live in a multi-cohort file with a different name
+        self._load_all()
         return self._cohorts.get(cohort_id)
 
     def list_cohorts(self) -> List[CohortConfig]:
         """Get all cohort configurations."""
+        self._load_all()
         return list(self._cohorts.values())
 
     def get_cohorts_by_tag(self, tag: str) -> List[CohortConfig]:
         """Get cohorts matching a specific tag."""
+        self._load_all()
         return [c for c in self._cohorts.values() if tag in c.tags]
 
     def save_cohort(self, cohort: CohortConfig):
@@ -118,10 +167,11 @@ class CohortConfigManager:
         filepath = self.config_dir / filename
 
         with open(filepath, "w") as f:
-            yaml.dump(cohort.to_dict(), f, default_flow_style=False)
+            yaml.dump(cohort.to_dict(), f, Dumper=_YamlDumper, default_flow_style=False)
 
-        # Reload to pick up changes
+        # Register directly; the file on disk now matches
         self._cohorts[cohort.id] = cohort
+        self._pending.pop(cohort.id, None)
 
 
 def create_example_configs() -> List[CohortConfig]:
@@ -1,6 +1,6 @@
 """Cohort management and coordination."""
 
-from pathlib import Path
+import json
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -86,29 +86,20 @@ class CohortManager:
         return self.pipeline.compare_cohorts(cohort_id1, cohort_id2)
 
     def get_cohort_summary(self, cohort_id: str) -> Dict:
-        """Get summary statistics for a cohort."""
+        """Get summary statistics for a cohort, preferring the precomputed sidecar."""
+        summary_path = self.pipeline.summary_path(cohort_id)
+        if summary_path.exists():
+            try:
+                with open(summary_path, "r") as f:
+                    return json.load(f)
+            except Exception:
+                pass  # Fall back to computing from the full frame
+
         results = self.pipeline.results.get(cohort_id)
         if results is None or results.empty:
             return {"error": f"No results found for cohort '{cohort_id}'"}
 
-        df = results
-        return {
-            "cohort_id": cohort_id,
-            "total_games": len(df),
-            "unique_players": len(set(df["white_player"]) | set(df["black_player"])),
-            "avg_plies_analyzed": df["plies_analyzed"].mean(),
-            "spbts_stats": {
-                "white_median": df["white_spbts"].median(),
-                "black_median": df["black_spbts"].median(),
-                "white_mean": df["white_spbts"].mean(),
-                "black_mean": df["black_spbts"].mean(),
-                "f_file_mean": df.get("white_f", pd.Series()).mean() if "white_f" in df.columns else None,
-            },
-            "date_range": {
-                "earliest": df["date"].min() if "date" in df.columns else None,
-                "latest": df["date"].max() if "date" in df.columns else None,
-            },
-        }
+        return self.pipeline.build_cohort_summary(cohort_id, results)
 
     def create_cohort(self, config: CohortConfig):
         """Create and save a new cohort configuration."""
@@ -129,16 +120,18 @@ class CohortManager:
 
     def delete_cohort_data(self, cohort_id: str):
         """Delete cached data for a cohort."""
-        data_dir = Path(self.pipeline.output_dir)
-
-        json_file = data_dir / f"{cohort_id}.json"
-        csv_file = data_dir / f"{cohort_id}.csv"
-
         deleted = []
-        for file_path in [json_file, csv_file]:
-            if file_path.exists():
+        for file_path in [
+            self.pipeline.pkl_path(cohort_id),
+            self.pipeline.json_path(cohort_id),
+            self.pipeline.csv_path(cohort_id),
+            self.pipeline.summary_path(cohort_id),
+        ]:
+            try:
                 file_path.unlink()
                 deleted.append(str(file_path))
+            except FileNotFoundError:
+                pass
 
         # Remove from memory
         if cohort_id in self.pipeline.results:
@@ -1,12 +1,14 @@
 """Multi-cohort data collection pipeline."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import pandas as pd
 
 from ..analysis import AnalysisPipeline
+from ..analysis.comparisons import compare_groups
 from ..analysis.grouping import GameFilter, PlayerClassifier
 from ..data.sources.lichess import LichessClient
 from ..data.sources.twic import TWICClient
@@ -22,6 +24,42 @@ class CohortPipeline:
         self.lichess_token = lichess_token
         self.results = {}
 
+    def json_path(self, cohort_id: str) -> Path:
+        """Path of the JSON results file for a cohort."""
+        return self.output_dir / f"{cohort_id}.json"
+
+    def csv_path(self, cohort_id: str) -> Path:
+        """Path of the CSV results file for a cohort."""
+        return self.output_dir / f"{cohort_id}.csv"
+
+    def pkl_path(self, cohort_id: str) -> Path:
+        """Path of the binary (pickle) results file for a cohort."""
+        return self.output_dir / f"{cohort_id}.pkl"
+
+    def summary_path(self, cohort_id: str) -> Path:
+        """Path of the precomputed summary sidecar for a cohort."""
+        return self.output_dir / f"{cohort_id}.summary.json"
+
+    def build_cohort_summary(self, cohort_id: str, df: pd.DataFrame) -> Dict:
+        """Compute the scalar summary stats for a cohort DataFrame."""
+        return {
+            "cohort_id": cohort_id,
+            "total_games": len(df),
+            "unique_players": int(pd.concat([df["white_player"], df["black_player"]], ignore_index=True).nunique()),
+            "avg_plies_analyzed": float(df["plies_analyzed"].mean()),
+            "spbts_stats": {
+                "white_median": float(df["white_spbts"].median()),
+                "black_median": float(df["black_spbts"].median()),
+                "white_mean": float(df["white_spbts"].mean()),
+                "black_mean": float(df["black_spbts"].mean()),
+                "f_file_mean": float(df["white_f"].mean()) if "white_f" in df.columns else None,
+            },
+            "date_range": {
+                "earliest": str(df["date"].min()) if "date" in df.columns else None,
+                "latest": str(df["date"].max()) if "date" in df.columns else None,
+            },
+        }
+
     def collect_cohort_data(self, cohort: CohortConfig) -> pd.DataFrame:
         """Collect data for a single cohort."""
         print(f"🎯 Collecting data for cohort: {cohort.name}")
@@ -56,7 +94,8 @@ class CohortPipeline:
             print(f"   ⚠️  No games collected for {cohort.id}")
             return pd.DataFrame()
 
-        # Run analysis
+        # Run analysis (the SPBTS pass inside fans out across CPU cores
+        # for large game lists; see analysis.comparisons._map_spbts)
         print(f"   🔍 Analyzing {games_collected} games...")
         try:
             pipeline.run_analysis()
@@ -217,49 +256,80 @@ class CohortPipeline:
         return []
 
     def _collect_pgn_files(self, source: Dict, max_games: int) -> List[str]:
-        """Collect games from PGN files."""
+        """Collect games from PGN files, streaming line-by-line.
+
+        Keeps at most one game in memory at a time and stops reading as
+        soon as max_games have been collected.
+        """
         file_paths = source.get("paths", [])
         games = []
 
         for file_path in file_paths:
+            if len(games) >= max_games:
+                break
+
             try:
                 path = Path(file_path)
-                if path.exists():
-                    with open(path, "r") as f:
-                        content = f.read()
-                        # Split PGN file into individual games
-                        pgn_games = content.split("\n\n[Event ")
-                        pgn_games = ["[Event " + game if i > 0 else game for i, game in enumerate(pgn_games)]
-                        games.extend(pgn_games[: max_games - len(games)])
+                if not path.exists():
+                    continue
 
-                        if len(games) >= max_games:
-                            break
+                with open(path, "r", errors="ignore") as f:
+                    current_game = []
+                    for line in f:
+                        if line.startswith("[Event ") and current_game:
+                            games.append("".join(current_game).strip())
+                            current_game = []
+                            if len(games) >= max_games:
+                                break
+                        current_game.append(line)
+
+                    if current_game and len(games) < max_games:
+                        games.append("".join(current_game).strip())
 
             except Exception as e:
                 print(f"   ❌ Failed to read {file_path}: {e}")
 
-        return games[:max_games]
+        return games
 
     def save_cohort_results(self, cohort_id: str, df: pd.DataFrame):
         """Save cohort results to disk."""
         if df.empty:
             return
 
-        # Save as JSON for the web app
-        json_path = self.output_dir / f"{cohort_id}.json"
+        # Binary copy loads fastest and round-trips dtypes exactly
+        pkl_path = self.pkl_path(cohort_id)
+        df.to_pickle(pkl_path)
+
+        # Save as JSON for the web app / external consumers. Compact output:
+        # pretty-printing dominates encode time and file size at cohort scale
+        json_path = self.json_path(cohort_id)
         with open(json_path, "w") as f:
-            json.dump(df.to_dict("records"), f, indent=2, default=str)
+            json.dump(df.to_dict("records"), f, separators=(",", ":"), default=str)
 
         # Save as CSV for analysis
-        csv_path = self.output_dir / f"{cohort_id}.csv"
+        csv_path = self.csv_path(cohort_id)
         df.to_csv(csv_path, index=False)
 
+        # Small scalar sidecar so status/summary reads skip the full frame
+        try:
+            with open(self.summary_path(cohort_id), "w") as f:
+                json.dump(self.build_cohort_summary(cohort_id, df), f, indent=2)
+        except Exception as e:
+            print(f"   ⚠️  Failed to write summary for {cohort_id}: {e}")
+
         print(f"   💾 Saved to {json_path} and {csv_path}")
 
     def load_cohort_results(self, cohort_id: str) -> Optional[pd.DataFrame]:
-        """Load existing cohort results from disk."""
-        json_path = self.output_dir / f"{cohort_id}.json"
+        """Load existing cohort results from disk, preferring the binary copy."""
+        pkl_path = self.pkl_path(cohort_id)
+        if pkl_path.exists():
+            try:
+                return pd.read_pickle(pkl_path)
+            except Exception as e:
+                print(f"Failed to load {pkl_path}: {e}")
 
+        # Legacy/interchange fallback
+        json_path = self.json_path(cohort_id)
         if json_path.exists():
             try:
                 with open(json_path, "r") as f:
@@ -270,32 +340,58 @@ class CohortPipeline:
 
         return None
 
-    def process_cohorts(self, cohorts: List[CohortConfig], force_refresh: bool = False):
-        """Process multiple cohorts, optionally refreshing cached data."""
+    def _cached_row_count(self, cohort_id: str) -> Optional[int]:
+        """Read the cached game count from the summary sidecar, if present."""
+        try:
+            with open(self.summary_path(cohort_id), "r") as f:
+                return int(json.load(f)["total_games"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def process_cohorts(self, cohorts: List[CohortConfig], force_refresh: bool = False, max_workers: int = 4):
+        """Process multiple cohorts, optionally refreshing cached data.
+
+        Cache hits resolve serially (fast); the remaining cohorts are
+        collected concurrently - collection is dominated by network waits,
+        so a small thread pool overlaps the downloads.
+        """
         # Sort by priority (higher first)
         sorted_cohorts = sorted(cohorts, key=lambda c: c.priority, reverse=True)
 
+        to_collect = []
         for cohort in sorted_cohorts:
             print(f"\n{'='*60}")
             print(f"Processing cohort: {cohort.name}")
             print(f"{'='*60}")
 
-            # Check if we already have results
+            # Check if we already have results. The summary sidecar gives the
+            # row count cheaply; only load the full frame if it will be used.
             if not force_refresh:
-                existing_df = self.load_cohort_results(cohort.id)
-                if existing_df is not None and len(existing_df) >= cohort.target_games * 0.8:
-                    print(f"   ✅ Using cached results ({len(existing_df)} games)")
-                    self.results[cohort.id] = existing_df
-                    continue
+                cached_rows = self._cached_row_count(cohort.id)
+                if cached_rows is None or cached_rows >= cohort.target_games * 0.8:
+                    existing_df = self.load_cohort_results(cohort.id)
+                    if existing_df is not None and len(existing_df) >= cohort.target_games * 0.8:
+                        print(f"   ✅ Using cached results ({len(existing_df)} games)")
+                        self.results[cohort.id] = existing_df
+                        continue
 
-            # Collect and analyze new data
-            df = self.collect_cohort_data(cohort)
+            to_collect.append(cohort)
 
-            if not df.empty:
-                self.save_cohort_results(cohort.id, df)
-                self.results[cohort.id] = df
-            else:
-                print(f"   ❌ No data collected for {cohort.id}")
+        if not to_collect:
+            return
+
+        # Collect and analyze new data, overlapping per-cohort network IO
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_collect))) as pool:
+            futures = {pool.submit(self.collect_cohort_data, cohort): cohort for cohort in to_collect}
+            for future in as_completed(futures):
+                cohort = futures[future]
+                df = future.result()
+
+                if not df.empty:
+                    self.save_cohort_results(cohort.id, df)
+                    self.results[cohort.id] = df
+                else:
+                    print(f"   ❌ No data collected for {cohort.id}")
 
     def get_results(self) -> Dict[str, pd.DataFrame]:
         """Get all cohort results."""
@@ -316,6 +412,4 @@ class CohortPipeline:
 
         combined_df = pd.concat([df1, df2], ignore_index=True)
 
-        from ..analysis.comparisons import compare_groups
-
         return compare_groups(combined_df, cohort_id1, cohort_id2, group_col="comparison_group")
@@ -1,12 +1,13 @@
 """Core chess analysis functions"""
 
-from .board_analysis import get_blocking_info, is_pawn_exposed
+from .board_analysis import get_blocking_info, get_file_status, is_pawn_exposed
 from .classification import classify_f_bucket_for_color
 from .metrics import calculate_spbts_for_game
 
 __all__ = [
     "is_pawn_exposed",
     "get_blocking_info",
+    "get_file_status",
     "calculate_spbts_for_game",
     "classify_f_bucket_for_color",
 ]
@@ -0,0 +1,89 @@
+"""Shared, cached PGN-to-positions construction.
+
+Both the SPBTS metrics and the f-bucket classifier need the same list of
+board positions for a game. Parsing the PGN and copying boards per ply is
+the expensive part, so it is done once here and memoized.
+"""
+
+from functools import lru_cache
+from io import StringIO
+from itertools import islice
+from typing import List, Optional
+
+import chess
+import chess.pgn
+
+
+class BoardSnapshot:
+    """Compact piece-placement snapshot of a position.
+
+    Holds just the bitboards the analysis code reads (a dozen ints versus
+    a full ``chess.Board`` with stacks and castling state) and mirrors the
+    small slice of the Board API the consumers use: ``pawns``,
+    ``occupied``, ``occupied_co`` and ``piece_at``.
+    """
+
+    __slots__ = ("pawns", "knights", "bishops", "rooks", "queens", "kings", "occupied", "occupied_co")
+
+    def __init__(self, board: chess.Board):
+        self.pawns = board.pawns
+        self.knights = board.knights
+        self.bishops = board.bishops
+        self.rooks = board.rooks
+        self.queens = board.queens
+        self.kings = board.kings
+        self.occupied = board.occupied
+        # Indexed by chess.Color like Board.occupied_co (BLACK=0, WHITE=1)
+        self.occupied_co = (board.occupied_co[chess.BLACK], board.occupied_co[chess.WHITE])
+
+    def piece_type_at(self, square: int) -> Optional[int]:
+        """Piece type on a square, decoded from the stored bitboards."""
+        mask = chess.BB_SQUARES[square]
+        if not self.occupied & mask:
+            return None
+        if self.pawns & mask:
+            return chess.PAWN
+        if self.knights & mask:
+            return chess.KNIGHT
+        if self.bishops & mask:
+            return chess.BISHOP
+        if self.rooks & mask:
+            return chess.ROOK
+        if self.queens & mask:
+            return chess.QUEEN
+        return chess.KING
+
+    def piece_at(self, square: int) -> Optional[chess.Piece]:
+        """Piece on a square, decoded from the stored bitboards."""
+        piece_type = self.piece_type_at(square)
+        if piece_type is None:
+            return None
+        return chess.Piece(piece_type, bool(self.occupied_co[chess.WHITE] & chess.BB_SQUARES[square]))
+
+
+@lru_cache(maxsize=256)
+def build_positions(pgn_text: str, max_plies: int = 24) -> Optional[List[BoardSnapshot]]:
+    """Parse a PGN and return position snapshots for plies 0..max_plies-1.
+
+    Returns None for unparseable PGN. Snapshots hold only the bitboards
+    (no move stacks or castling state), cutting per-ply memory by an order
+    of magnitude versus full board copies. Results are cached, so callers
+    must not mutate the returned snapshots.
+    """
+    game = chess.pgn.read_game(StringIO(pgn_text))
+    if game is None:
+        return None
+
+    # Handle custom starting positions (Chess960, etc.)
+    if game.headers.get("SetUp") == "1" and "FEN" in game.headers:
+        board = chess.Board(game.headers["FEN"])
+    else:
+        board = chess.Board()
+
+    # islice stops walking the mainline as soon as the window is filled
+    positions = [BoardSnapshot(board)]
+    for move in islice(game.mainline_moves(), max_plies - 1):
+        board.push(move)
+        positions.append(BoardSnapshot(board))
+
+    return positions
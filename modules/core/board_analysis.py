@@ -6,20 +6,24 @@ import chess
 
 FILES = "abcdefgh"
 
+# Precomputed (start, ahead) squares per color/file; these get probed per
+# ply per file across thousands of games, so skip the square arithmetic
+_PAWN_SQUARES = {
+    chess.WHITE: tuple((chess.square(f, 1), chess.square(f, 2)) for f in range(8)),  # e.g., f2, f3
+    chess.BLACK: tuple((chess.square(f, 6), chess.square(f, 5)) for f in range(8)),  # e.g., f7, f6
+}
+
 
 def get_pawn_start_and_ahead_squares(file_idx: int, color: chess.Color) -> Tuple[int, int]:
     """Get the starting square and square directly ahead for a pawn on given file."""
-    if color == chess.WHITE:
-        return chess.square(file_idx, 1), chess.square(file_idx, 2)  # e.g., f2, f3
-    else:
-        return chess.square(file_idx, 6), chess.square(file_idx, 5)  # e.g., f7, f6
+    return _PAWN_SQUARES[color][file_idx]
 
 
 def is_pawn_exposed(board: chess.Board, file_idx: int, color: chess.Color) -> bool:
     """Check if a pawn is still on its starting square (exposed)."""
-    start_sq, _ = get_pawn_start_and_ahead_squares(file_idx, color)
-    piece = board.piece_at(start_sq)
-    return piece is not None and piece.piece_type == chess.PAWN and piece.color == color
+    start_sq = _PAWN_SQUARES[color][file_idx][0]
+    # Bitboard AND avoids allocating a Piece object per probe
+    return bool(board.pawns & board.occupied_co[color] & chess.BB_SQUARES[start_sq])
 
 
 def get_blocking_info(board: chess.Board, file_idx: int, color: chess.Color) -> Tuple[bool, bool, bool, Optional[int]]:
@@ -29,20 +33,50 @@ def get_blocking_info(board: chess.Board, file_idx: int, color: chess.Color) ->
     Returns:
         (friendly_non_pawn_block, enemy_block, any_block, blocker_piece_type)
     """
-    _, ahead_sq = get_pawn_start_and_ahead_squares(file_idx, color)
-    piece = board.piece_at(ahead_sq)
+    ahead_sq = _PAWN_SQUARES[color][file_idx][1]
+    ahead_mask = chess.BB_SQUARES[ahead_sq]
 
-    if piece is None:
+    # Cheap occupancy test first; the common case is an empty square
+    if not board.occupied & ahead_mask:
         return False, False, False, None
 
-    any_block = True
-    if piece.color == color:
-        friendly_non_pawn_block = piece.piece_type != chess.PAWN
-        return friendly_non_pawn_block, False, any_block, piece.piece_type
+    # Bitboard tests resolve color and type without allocating a Piece
+    piece_type = board.piece_type_at(ahead_sq)
+    if board.occupied_co[color] & ahead_mask:
+        return piece_type != chess.PAWN, False, True, piece_type
+    else:
+        return False, True, True, piece_type
+
+
+def get_file_status(
+    board: chess.Board, file_idx: int, color: chess.Color
+) -> Tuple[bool, bool, bool, bool, Optional[int]]:
+    """
+    Fused exposure + blocking probe for a pawn file.
+
+    One table lookup and one set of bitboard tests covers what separate
+    is_pawn_exposed/get_blocking_info calls would each redo.
+
+    Returns:
+        (exposed, friendly_non_pawn_block, enemy_block, any_block, blocker_piece_type)
+    """
+    start_sq, ahead_sq = _PAWN_SQUARES[color][file_idx]
+    ahead_mask = chess.BB_SQUARES[ahead_sq]
+
+    exposed = bool(board.pawns & board.occupied_co[color] & chess.BB_SQUARES[start_sq])
+    if not exposed or not board.occupied & ahead_mask:
+        return exposed, False, False, False, None
+
+    piece_type = board.piece_type_at(ahead_sq)
+    if board.occupied_co[color] & ahead_mask:
+        return exposed, piece_type != chess.PAWN, False, True, piece_type
     else:
-        return False, True, any_block, piece.piece_type
+        return exposed, False, True, True, piece_type
 
 
 def get_file_index(file_letter: str) -> int:
     """Convert file letter to index (a=0, b=1, ..., h=7)."""
-    return FILES.index(file_letter)
+    idx = ord(file_letter) - ord("a")
+    if not 0 <= idx < 8:
+        raise ValueError(f"Invalid file letter: {file_letter!r}")
+    return idx
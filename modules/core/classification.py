@@ -1,11 +1,12 @@
 """F-file bucket classification and other pattern analysis"""
 
-from io import StringIO
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import chess
 import chess.pgn
 
+from ._pgn_cache import build_positions
 from .board_analysis import get_file_index, get_pawn_start_and_ahead_squares
 
 
@@ -22,83 +23,67 @@ def classify_f_bucket_for_color(positions: List[chess.Board], color: chess.Color
         Bucket classification string
     """
     file_idx = get_file_index("f")
+    start_sq, ahead_sq = get_pawn_start_and_ahead_squares(file_idx, color)
+    bb_start = chess.BB_SQUARES[start_sq]
+    bb_ahead = chess.BB_SQUARES[ahead_sq]
+
+    # Stream the plies and return the moment the verdict is fixed: a clean
+    # move-off settles A2/A3/other, and the end of the first blocking
+    # episode settles B4/B5. Bitboard ANDs avoid decoding a Piece per probe.
+    first_block_ply = None
+    prev_exposed = False
+
+    for t, position in enumerate(positions):
+        own = position.occupied_co[color]
+        is_exposed = bool(position.pawns & own & bb_start)
+
+        if prev_exposed and not is_exposed:
+            if first_block_ply is not None:
+                # Pawn moved while blocked: episode ends here
+                return "B4" if t - first_block_ply <= 2 else "B5"
+
+            # Moved with no prior block; classify by landing square
+            bb_f3 = chess.BB_SQUARES[chess.square(file_idx, 2 if color == chess.WHITE else 5)]
+            bb_f4 = chess.BB_SQUARES[chess.square(file_idx, 3 if color == chess.WHITE else 4)]
+            own_pawns = position.pawns & own
+            if own_pawns & bb_f3:
+                return "A2"  # Moved one square
+            elif own_pawns & bb_f4:
+                return "A3"  # Moved two squares
+            else:
+                return "other"  # Moved by capture or other
 
-    # Track exposure and friendly blocking per ply
-    exposed = []
-    friendly_blocks = []
-
-    for position in positions:
-        start_sq, ahead_sq = get_pawn_start_and_ahead_squares(file_idx, color)
+        if is_exposed:
+            has_friendly_block = bool(own & ~position.pawns & bb_ahead)
+            if has_friendly_block:
+                if first_block_ply is None:
+                    first_block_ply = t
+            elif first_block_ply is not None:
+                # Blocker left while pawn still home: episode ends here
+                return "B4" if t - first_block_ply <= 2 else "B5"
 
-        # Check if f-pawn is exposed (on starting square)
-        pawn = position.piece_at(start_sq)
-        is_exposed = pawn is not None and pawn.piece_type == chess.PAWN and pawn.color == color
-        exposed.append(is_exposed)
+        prev_exposed = is_exposed
 
-        # Check for friendly non-pawn block if exposed
-        if is_exposed:
-            blocker = position.piece_at(ahead_sq)
-            has_friendly_block = blocker is not None and blocker.color == color and blocker.piece_type != chess.PAWN
-            friendly_blocks.append(has_friendly_block)
-        else:
-            friendly_blocks.append(False)
-
-    # Find when pawn first moves off starting square
-    move_off_ply = None
-    for t in range(1, len(positions)):
-        if exposed[t - 1] and not exposed[t]:
-            move_off_ply = t
-            break
-
-    # Check if there was any friendly blocking while exposed
-    any_friendly_block = any(friendly_blocks)
-
-    # Classification logic
-    if move_off_ply is None and not any_friendly_block:
+    if first_block_ply is None:
         return "A1"  # Never moved, never blocked
 
-    # If moved with no prior friendly block, check destination
-    if move_off_ply is not None and not any(friendly_blocks[:move_off_ply]):
-        position = positions[move_off_ply]
-
-        # Check if pawn landed on f3/f6 (one square) or f4/f5 (two squares)
-        f3_or_f6 = chess.square(file_idx, 2 if color == chess.WHITE else 5)
-        f4_or_f5 = chess.square(file_idx, 3 if color == chess.WHITE else 4)
-
-        pawn_on_f3 = position.piece_at(f3_or_f6)
-        pawn_on_f4 = position.piece_at(f4_or_f5)
-
-        if pawn_on_f3 and pawn_on_f3.piece_type == chess.PAWN and pawn_on_f3.color == color:
-            return "A2"  # Moved one square
-        elif pawn_on_f4 and pawn_on_f4.piece_type == chess.PAWN and pawn_on_f4.color == color:
-            return "A3"  # Moved two squares
-        else:
-            return "other"  # Moved by capture or other
-
-    # Had friendly blocking: compute first episode duration
-    block_start = None
-    for t in range(len(positions)):
-        if friendly_blocks[t]:
-            block_start = t
-            break
-
-    if block_start is None:
-        return "other"
-
-    # Find when blocking episode ends
-    block_end = len(positions)  # Default: censored at window end
-    for t in range(block_start + 1, len(positions)):
-        if not exposed[t]:  # Pawn moved
-            block_end = t
-            break
-        if exposed[t] and not friendly_blocks[t]:  # Blocker left
-            block_end = t
-            break
-
-    duration = block_end - block_start
+    # Blocking episode censored at the window end
+    duration = len(positions) - first_block_ply
     return "B4" if duration <= 2 else "B5"
 
 
+@lru_cache(maxsize=256)
+def _classify_f_buckets_cached(pgn_text: str, max_plies: int) -> Optional[Tuple[str, str]]:
+    """Memoized (white, black) buckets; archives often repeat games."""
+    positions = build_positions(pgn_text, max_plies)
+    if positions is None:
+        return None
+    return (
+        classify_f_bucket_for_color(positions, chess.WHITE, max_plies),
+        classify_f_bucket_for_color(positions, chess.BLACK, max_plies),
+    )
+
+
 def classify_f_buckets_from_pgn(pgn_text: str, max_plies: int = 24) -> Optional[Dict[str, str]]:
     """
     Classify f-file buckets for both sides from a PGN string.
@@ -106,27 +91,8 @@ def classify_f_buckets_from_pgn(pgn_text: str, max_plies: int = 24) -> Optional[
     Returns:
         Dictionary with 'white' and 'black' bucket classifications, or None if invalid PGN
     """
-    game = chess.pgn.read_game(StringIO(pgn_text))
-    if game is None:
+    buckets = _classify_f_buckets_cached(pgn_text, max_plies)
+    if buckets is None:
         return None
-
-    # Handle custom starting positions
-    if game.headers.get("SetUp") == "1" and "FEN" in game.headers:
-        board = chess.Board(game.headers["FEN"])
-    else:
-        board = chess.Board()
-
-    # Build position list
-    positions = [board.copy()]
-    moves = list(game.mainline_moves())
-
-    for i, move in enumerate(moves):
-        if i >= max_plies - 1:
-            break
-        board.push(move)
-        positions.append(board.copy())
-
-    return {
-        "white": classify_f_bucket_for_color(positions, chess.WHITE, max_plies),
-        "black": classify_f_bucket_for_color(positions, chess.BLACK, max_plies),
-    }
+    # Fresh dict per call so callers can mutate without poisoning the cache
+    return {"white": buckets[0], "black": buckets[1]}
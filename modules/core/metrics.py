@@ -1,14 +1,27 @@
 """SPBTS (Self-Pawn Block To Start) metrics calculation"""
 
-from collections import defaultdict
-from io import StringIO
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import chess
 import chess.pgn
+import numpy as np
 import pandas as pd
 
-from .board_analysis import FILES, get_blocking_info, is_pawn_exposed
+from ._pgn_cache import build_positions
+from .board_analysis import FILES, get_file_status, get_pawn_start_and_ahead_squares
+
+# Piece symbols indexed by piece type; a tuple lookup beats a
+# chess.piece_symbol call per blocked trace cell
+_PIECE_SYMBOLS = (None, "p", "n", "b", "r", "q", "k")
+
+# Per-color (8,) uint64 masks of the start and ahead squares, so a whole
+# game's exposure/blocking grid reduces to a few vectorized bitwise ANDs
+_START_MASKS = {}
+_AHEAD_MASKS = {}
+for _color in (chess.WHITE, chess.BLACK):
+    _squares = [get_pawn_start_and_ahead_squares(f, _color) for f in range(8)]
+    _START_MASKS[_color] = np.array([chess.BB_SQUARES[s] for s, _ in _squares], dtype=np.uint64)
+    _AHEAD_MASKS[_color] = np.array([chess.BB_SQUARES[a] for _, a in _squares], dtype=np.uint64)
 
 
 def track_f_pawn_fate(positions: List[chess.Board], color: chess.Color) -> Dict[str, int]:
@@ -35,61 +48,42 @@ def track_f_pawn_fate(positions: List[chess.Board], color: chess.Color) -> Dict[
         "permanent_block": 0,
     }
 
-    # Track F-pawn blocking events and position changes
-    pawn_present_plies = []
-    blocked_plies = []
+    # Single left-to-right sweep; one fused exposure+blocking probe per ply.
+    # State: whether the pawn has appeared, been blocked, been freed.
+    ever_present = False
+    ever_blocked = False
+    freed_after_block = False
+    prev_exposed = False
+    movement_fate = None
 
     for ply_idx, position in enumerate(positions):
-        if is_pawn_exposed(position, f_file_idx, color):
-            pawn_present_plies.append(ply_idx)
-            friendly_np, _, _, _ = get_blocking_info(position, f_file_idx, color)
+        exposed_now, friendly_np, _, _, _ = get_file_status(position, f_file_idx, color)
+
+        if exposed_now:
+            ever_present = True
             if friendly_np:
-                blocked_plies.append(ply_idx)
+                ever_blocked = True
+            elif ever_blocked:
+                freed_after_block = True  # Blocker left while pawn still home
+        elif prev_exposed:
+            # Pawn just left its starting square; determine where it went
+            movement_fate = _determine_pawn_movement(positions[ply_idx - 1], position, f_file_idx, color)
+            break
 
-    # If F-pawn never appeared on starting square, skip
-    if not pawn_present_plies:
-        return fates
+        prev_exposed = exposed_now
 
-    # Check if pawn ever moved
-    pawn_moved = False
-    pawn_movement_fate = None
-
-    for ply_idx in range(len(positions) - 1):
-        if pawn_present_plies and ply_idx in pawn_present_plies:
-            # Pawn is present at this ply, check if it moves next ply
-            if ply_idx + 1 < len(positions):
-                next_position = positions[ply_idx + 1]
-                if not is_pawn_exposed(next_position, f_file_idx, color):
-                    # Pawn moved! Determine where
-                    pawn_movement_fate = _determine_pawn_movement(positions[ply_idx], next_position, f_file_idx, color)
-                    pawn_moved = True
-                    break
-
-    if pawn_moved and pawn_movement_fate:
-        fates[pawn_movement_fate] += 1
+    # If F-pawn never appeared on starting square, skip
+    if not ever_present:
         return fates
 
-    # Pawn never moved - classify based on blocking behavior
-    if not blocked_plies:
-        # Never blocked at all
+    if movement_fate:
+        fates[movement_fate] += 1
+    elif not ever_blocked:
         fates["never_blocked"] += 1
+    elif freed_after_block:
+        fates["temporary_block"] += 1
     else:
-        # Was blocked - check if it got freed
-        first_block_ply = blocked_plies[0]
-        pawn_freed = False
-
-        for ply_idx in range(first_block_ply + 1, len(positions)):
-            if ply_idx in pawn_present_plies:
-                position = positions[ply_idx]
-                friendly_np, _, _, _ = get_blocking_info(position, f_file_idx, color)
-                if not friendly_np:  # No longer blocked
-                    pawn_freed = True
-                    break
-
-        if pawn_freed:
-            fates["temporary_block"] += 1
-        else:
-            fates["permanent_block"] += 1
+        fates["permanent_block"] += 1
 
     return fates
 
@@ -126,93 +120,106 @@ def _determine_pawn_movement(before_pos: chess.Board, after_pos: chess.Board, fi
     return None
 
 
-def calculate_spbts_for_game(pgn_text: str, max_plies: int = 24) -> Tuple[Dict, pd.DataFrame]:
+def _build_trace_df(positions: List[chess.Board], flags: Dict) -> pd.DataFrame:
+    """Build the per-ply trace DataFrame from the precomputed flag grids.
+
+    Columns are typed NumPy arrays / categoricals rather than per-row
+    dicts. Row order matches the original loop: ply, then color, then file.
+    """
+    num_plies = len(positions)
+
+    def _interleave(white_grid: np.ndarray, black_grid: np.ndarray) -> np.ndarray:
+        return np.stack((white_grid, black_grid), axis=1).reshape(-1)
+
+    num_rows = num_plies * 16
+    any_col = _interleave(flags[chess.WHITE][3], flags[chess.BLACK][3])
+
+    # Blocker types are only decoded for the few blocked cells; codes are
+    # piece_type - 1, with -1 (NaN) for unblocked cells
+    blocker_codes = np.full(num_rows, -1, dtype=np.int8)
+    for row in np.flatnonzero(any_col):
+        color = chess.WHITE if (row // 8) % 2 == 0 else chess.BLACK
+        ahead_sq = get_pawn_start_and_ahead_squares(row % 8, color)[1]
+        blocker_codes[row] = positions[row // 16].piece_type_at(ahead_sq) - 1
+
+    return pd.DataFrame(
+        {
+            "ply_index": np.repeat(np.arange(num_plies, dtype=np.int32), 16),
+            "color": pd.Categorical.from_codes(
+                np.tile(np.repeat(np.array([0, 1], dtype=np.int8), 8), num_plies), categories=["white", "black"]
+            ),
+            "file": pd.Categorical.from_codes(
+                np.tile(np.arange(8, dtype=np.int8), num_plies * 2), categories=list(FILES)
+            ),
+            "exposed": _interleave(flags[chess.WHITE][0], flags[chess.BLACK][0]).astype(np.int8),
+            "friendly_np_block": _interleave(flags[chess.WHITE][1], flags[chess.BLACK][1]).astype(np.int8),
+            "enemy_block": _interleave(flags[chess.WHITE][2], flags[chess.BLACK][2]).astype(np.int8),
+            "any_block": any_col.astype(np.int8),
+            "blocker_piece": pd.Categorical.from_codes(blocker_codes, categories=list(_PIECE_SYMBOLS[1:])),
+        }
+    )
+
+
+def calculate_spbts_for_game(
+    pgn_text: str, max_plies: int = 24, include_trace: bool = True
+) -> Tuple[Dict, Optional[pd.DataFrame]]:
     """
     Calculate SPBTS metrics for a single game.
 
     Args:
         pgn_text: PGN string of the game
         max_plies: Maximum number of plies to analyze
+        include_trace: Build the per-ply trace DataFrame; pass False on
+            bulk paths that only need the summary
 
     Returns:
         (summary_by_side, trace_df): Summary statistics and detailed trace
+        (trace_df is None when include_trace is False)
     """
-    game = chess.pgn.read_game(StringIO(pgn_text))
-    if game is None:
+    # Positions are built once per (game, max_plies) and shared with the
+    # f-bucket classifier via the module-level cache
+    positions = build_positions(pgn_text, max_plies)
+    if positions is None:
         raise ValueError("Invalid PGN")
 
-    # Handle custom starting positions (Chess960, etc.)
-    if game.headers.get("SetUp") == "1" and "FEN" in game.headers:
-        board = chess.Board(game.headers["FEN"])
-    else:
-        board = chess.Board()
-
-    # Get all positions up to max_plies
-    positions = [board.copy()]
-    moves = list(game.mainline_moves())
-
-    for i, move in enumerate(moves):
-        if i >= max_plies - 1:
-            break
-        board.push(move)
-        positions.append(board.copy())
+    # Stack the per-ply bitboards once, then resolve every (ply, color, file)
+    # exposure/blocking flag with vectorized uint64 ops instead of 384+
+    # Python-level board probes per game
+    num_plies = len(positions)
+    pawns = np.fromiter((pos.pawns for pos in positions), dtype=np.uint64, count=num_plies)
+    occ_co = {
+        color: np.fromiter((pos.occupied_co[color] for pos in positions), dtype=np.uint64, count=num_plies)
+        for color in (chess.WHITE, chess.BLACK)
+    }
 
-    # Aggregate counters and detailed trace
-    aggregates = {chess.WHITE: defaultdict(int), chess.BLACK: defaultdict(int)}
-    per_file_exposure = {chess.WHITE: [0] * 8, chess.BLACK: [0] * 8}
-    per_file_friendly_blocks = {chess.WHITE: [0] * 8, chess.BLACK: [0] * 8}
-    trace_rows = []
+    aggregates = {}
+    per_file_exposure = {}
+    per_file_friendly_blocks = {}
+    flags = {}
+
+    for color in (chess.WHITE, chess.BLACK):
+        own = occ_co[color][:, None]
+        other = occ_co[not color][:, None]
+        start = _START_MASKS[color][None, :]
+        ahead = _AHEAD_MASKS[color][None, :]
+
+        # (plies, 8) bool grids; blocks only count while the pawn is exposed
+        exposed = (pawns[:, None] & own & start) != 0
+        friendly_np = exposed & ((own & ~pawns[:, None] & ahead) != 0)
+        enemy = exposed & ((other & ahead) != 0)
+        any_block = exposed & (((own | other) & ahead) != 0)
+        flags[color] = (exposed, friendly_np, enemy, any_block)
+
+        aggregates[color] = {
+            "exposure": int(exposed.sum()),
+            "friendly_np": int(friendly_np.sum()),
+            "enemy": int(enemy.sum()),
+            "any": int(any_block.sum()),
+        }
+        per_file_exposure[color] = exposed.sum(axis=0).tolist()
+        per_file_friendly_blocks[color] = friendly_np.sum(axis=0).tolist()
 
-    # Analyze each position
-    for ply_idx, position in enumerate(positions):
-        for color in (chess.WHITE, chess.BLACK):
-            for file_idx in range(8):
-                color_str = "white" if color == chess.WHITE else "black"
-
-                if is_pawn_exposed(position, file_idx, color):
-                    # Count exposure
-                    aggregates[color]["exposure"] += 1
-                    per_file_exposure[color][file_idx] += 1
-
-                    # Get blocking info
-                    friendly_np, enemy, any_block, piece_type = get_blocking_info(position, file_idx, color)
-
-                    if friendly_np:
-                        aggregates[color]["friendly_np"] += 1
-                        per_file_friendly_blocks[color][file_idx] += 1
-                    if enemy:
-                        aggregates[color]["enemy"] += 1
-                    if any_block:
-                        aggregates[color]["any"] += 1
-
-                    trace_rows.append(
-                        {
-                            "ply_index": ply_idx,
-                            "color": color_str,
-                            "file": FILES[file_idx],
-                            "exposed": 1,
-                            "friendly_np_block": int(friendly_np),
-                            "enemy_block": int(enemy),
-                            "any_block": int(any_block),
-                            "blocker_piece": None if piece_type is None else chess.piece_symbol(piece_type),
-                        }
-                    )
-                else:
-                    # Not exposed
-                    trace_rows.append(
-                        {
-                            "ply_index": ply_idx,
-                            "color": color_str,
-                            "file": FILES[file_idx],
-                            "exposed": 0,
-                            "friendly_np_block": 0,
-                            "enemy_block": 0,
-                            "any_block": 0,
-                            "blocker_piece": None,
-                        }
-                    )
-
-    trace_df = pd.DataFrame(trace_rows)
+    trace_df = _build_trace_df(positions, flags) if include_trace else None
 
     def summarize_side(color: chess.Color) -> Dict:
         """Summarize SPBTS metrics for one side."""
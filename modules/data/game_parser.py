@@ -1,7 +1,11 @@
 """PGN parsing utilities"""
 
+import re
 from typing import Dict, Tuple
 
+# Header tag line: [Key "Value"]
+_HEADER_RE = re.compile(r'^\[(\w+)\s+"([^"]*)"\]', re.MULTILINE)
+
 
 def parse_player_names(pgn_text: str) -> Tuple[str, str, Dict[str, str]]:
     """
@@ -10,16 +14,11 @@ def parse_player_names(pgn_text: str) -> Tuple[str, str, Dict[str, str]]:
     Returns:
         (white_player, black_player, all_headers)
     """
-    headers = {}
-
-    for line in pgn_text.splitlines():
-        if line.startswith("["):
-            # Parse header line: [Key "Value"]
-            parts = line.split('"')
-            if len(parts) >= 2:
-                key = line.split()[0][1:]  # Remove opening bracket
-                value = parts[1]  # Value between quotes
-                headers[key] = value
+    # Headers end at the first blank line; one regex pass over that
+    # section beats splitting every movetext line
+    header_end = pgn_text.find("\n\n")
+    header_section = pgn_text[:header_end] if header_end != -1 else pgn_text
+    headers = dict(_HEADER_RE.findall(header_section))
 
     white_player = headers.get("White", "")
     black_player = headers.get("Black", "")
@@ -57,7 +56,8 @@ def extract_game_metadata(headers: Dict[str, str]) -> Dict:
 
 def _safe_int(value: str) -> int:
     """Safely convert string to int, return None if invalid."""
-    if value is None:
+    # Missing and empty values short-circuit without exception machinery
+    if not value:
         return None
     try:
         return int(value)
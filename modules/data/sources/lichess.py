@@ -1,10 +1,14 @@
 """Lichess API client for game data collection"""
 
 import json
+import re
 from typing import Iterator, Optional
 
 import requests
 
+# Usernames that look like engines/bots; compiled once, scanned at C level
+_BOT_RE = re.compile(r"bot|engine|stockfish|leela|lc0|komodo|fire|dragon|computer|maia", re.IGNORECASE)
+
 
 class LichessClient:
     """Client for fetching games from Lichess API."""
@@ -18,13 +22,25 @@ class LichessClient:
         """
         self.token = token
         self.base_url = "https://lichess.org/api"
+        # Persistent session keeps connections alive across calls, saving
+        # a TCP+TLS handshake per request in batch lookups
+        self.session = requests.Session()
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def close(self):
+        """Release the session's connection pool."""
+        self.session.close()
+
+    def __enter__(self) -> "LichessClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _get_headers(self) -> dict:
-        """Get HTTP headers for API requests."""
-        headers = {"Accept": "application/x-ndjson"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+        """Get HTTP headers for API requests (auth rides on the session)."""
+        return {"Accept": "application/x-ndjson"}
 
     def stream_user_games(
         self, username: str, max_games: int = 200, include_moves: bool = True, timeout: int = 60
@@ -45,7 +61,7 @@ class LichessClient:
         params = {"max": max_games, "moves": str(include_moves).lower(), "pgnInJson": "true"}
         headers = self._get_headers()
 
-        with requests.get(url, params=params, headers=headers, stream=True, timeout=timeout) as response:
+        with self.session.get(url, params=params, headers=headers, stream=True, timeout=timeout) as response:
             response.raise_for_status()
 
             for line in response.iter_lines():
@@ -53,7 +69,8 @@ class LichessClient:
                     continue
 
                 try:
-                    game_data = json.loads(line.decode("utf-8"))
+                    # json.loads takes bytes directly; no per-line decode
+                    game_data = json.loads(line)
                     pgn = game_data.get("pgn", "")
                     if pgn:
                         yield pgn
@@ -79,12 +96,10 @@ class LichessClient:
         # Use public leaderboard endpoint to find players in rating range
         url = f"{self.base_url}/player"
         headers = {"Accept": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
 
         try:
             # Get online players (more likely to be active humans)
-            response = requests.get(f"{url}/online", headers=headers, timeout=10)
+            response = self.session.get(f"{url}/online", headers=headers, timeout=10)
             response.raise_for_status()
 
             online_players = response.json().get("users", [])
@@ -123,9 +138,7 @@ class LichessClient:
 
     def _looks_like_bot(self, username: str) -> bool:
         """Simple heuristic to detect bot/engine usernames."""
-        bot_patterns = ["bot", "engine", "stockfish", "leela", "lc0", "komodo", "fire", "dragon", "computer", "maia"]
-        username_lower = username.lower()
-        return any(pattern in username_lower for pattern in bot_patterns)
+        return _BOT_RE.search(username) is not None
 
     def get_user_info(self, username: str) -> dict:
         """
@@ -139,9 +152,7 @@ class LichessClient:
         """
         url = f"{self.base_url}/user/{username}"
         headers = {"Accept": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
 
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
@@ -1,13 +1,33 @@
 """TWIC (The Week in Chess) data source for chess games."""
 
+import io
+import os
 import re
-import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator, List, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Issue links on the TWIC index page look like twic1604g.zip
+_ISSUE_RE = re.compile(r"twic(\d{4})g\.zip")
+
+# Both Elo tags in one alternation for the rating-filter hot path
+_ELO_RE = re.compile(r'\[(WhiteElo|BlackElo)\s+"(\d+)"\]')
+
+# Games start at an Event header; a lookahead split keeps the header line
+_PGN_SPLIT_RE = re.compile(r"(?m)^(?=\[Event )")
+
+# One compiled rating pattern per header tag (WhiteElo/BlackElo in practice)
+_RATING_RE_CACHE: dict = {}
+
+
+def _rating_pattern(rating_tag: str) -> "re.Pattern":
+    return _RATING_RE_CACHE.setdefault(rating_tag, re.compile(rf'\[{rating_tag}\s+"(\d+)"\]'))
 
 
 class TWICClient:
@@ -17,6 +37,14 @@ class TWICClient:
         self.base_url = "https://theweekinchess.com/zips/"
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; Chess Analysis Bot)"})
+        # Keep-alive pooling so sequential issue downloads reuse one
+        # TCP+TLS connection, with retry/backoff for transient errors
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
 
     def get_latest_issue_number(self) -> Optional[int]:
         """Get the latest TWIC issue number by checking the main page."""
@@ -25,8 +53,7 @@ class TWICClient:
             response.raise_for_status()
 
             # Look for issue numbers in the HTML
-            issue_pattern = r"twic(\d{4})g\.zip"
-            matches = re.findall(issue_pattern, response.text)
+            matches = _ISSUE_RE.findall(response.text)
 
             if matches:
                 return max(int(match) for match in matches)
@@ -47,24 +74,18 @@ class TWICClient:
         Returns:
             List of PGN game strings
         """
-        pgn_url = f"{self.base_url}twic{issue_number:04d}g.zip"
-
         try:
-            print(f"   📥 Downloading TWIC {issue_number}...")
-            response = self.session.get(pgn_url, timeout=30)
-            response.raise_for_status()
+            data = self._fetch_issue_zip(issue_number)
 
             games = []
-            with tempfile.NamedTemporaryFile() as temp_file:
-                temp_file.write(response.content)
-                temp_file.flush()
-
-                with zipfile.ZipFile(temp_file.name, "r") as zip_file:
-                    for file_name in zip_file.namelist():
-                        if file_name.endswith(".pgn"):
-                            with zip_file.open(file_name) as pgn_file:
-                                content = pgn_file.read().decode("utf-8", errors="ignore")
-                                games.extend(self._split_pgn_content(content))
+            # ZipFile just needs a seekable stream; a TWIC issue is a few
+            # MB, so unzip straight from memory instead of a temp file
+            with zipfile.ZipFile(io.BytesIO(data), "r") as zip_file:
+                for file_name in zip_file.namelist():
+                    if file_name.endswith(".pgn"):
+                        with zip_file.open(file_name) as pgn_file:
+                            content = pgn_file.read().decode("utf-8", errors="ignore")
+                            games.extend(self._split_pgn_content(content))
 
             print(f"   ✅ Extracted {len(games)} games from TWIC {issue_number}")
             return games
@@ -79,6 +100,47 @@ class TWICClient:
             print(f"   ❌ Error processing TWIC {issue_number}: {e}")
             return []
 
+    def _fetch_issue_zip(self, issue_number: int) -> bytes:
+        """Fetch an issue's zip, serving published issues from a local cache."""
+        file_name = f"twic{issue_number:04d}g.zip"
+        cache_dir = Path(os.environ.get("TWIC_CACHE", Path.home() / ".cache" / "pawn_blockers" / "twic"))
+        cache_path = cache_dir / file_name
+
+        # Published issues never change, so a cache hit skips HTTP entirely
+        if cache_path.exists():
+            print(f"   📂 Using cached TWIC {issue_number}")
+            return cache_path.read_bytes()
+
+        print(f"   📥 Downloading TWIC {issue_number}...")
+        # Stream into a buffer pre-sized from Content-Length so the
+        # payload is written once instead of concatenated from chunks
+        with self.session.get(f"{self.base_url}{file_name}", timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            size = int(response.headers.get("Content-Length", 0))
+            buffer = bytearray(size)
+            offset = 0
+            for chunk in response.iter_content(65536):
+                # Slice assignment overwrites in place and grows the
+                # buffer if the header under-reported
+                buffer[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+            del buffer[offset:]
+
+        data = bytes(buffer)
+
+        # Write-then-rename keeps concurrent downloaders from ever seeing
+        # a partial zip; a failed write just means no cache entry
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.rename(cache_path)
+        except OSError:
+            pass
+
+        return data
+
     def download_recent_games(self, max_games: int = 1000, max_issues: int = 5) -> Iterator[str]:
         """
         Download recent games from latest TWIC issues.
@@ -95,22 +157,31 @@ class TWICClient:
             print("   ❌ Could not determine latest TWIC issue")
             return
 
-        games_collected = 0
-
-        for issue_offset in range(max_issues):
-            issue_number = latest_issue - issue_offset
-
-            if issue_number < 1:
-                break
+        issue_numbers = [latest_issue - offset for offset in range(max_issues) if latest_issue - offset >= 1]
+        if not issue_numbers:
+            return
 
-            issue_games = self.download_issue_games(issue_number)
+        games_collected = 0
 
-            for game in issue_games:
-                if games_collected >= max_games:
-                    return
+        # Download issues concurrently (a few workers, to be polite to the
+        # server) but yield games in descending issue order
+        with ThreadPoolExecutor(max_workers=min(4, len(issue_numbers))) as executor:
+            futures = [executor.submit(self.download_issue_games, n) for n in issue_numbers]
 
-                yield game
-                games_collected += 1
+            try:
+                for future in futures:
+                    for game in future.result():
+                        if games_collected >= max_games:
+                            return
+
+                        yield game
+                        games_collected += 1
+            finally:
+                # Runs on normal exit, early return, and generator close
+                # (e.g. a filtered consumer breaking out mid-stream), so
+                # queued issues are never downloaded pointlessly
+                for pending in futures:
+                    pending.cancel()
 
         print(f"   📊 Total TWIC games collected: {games_collected}")
 
@@ -134,12 +205,13 @@ class TWICClient:
             if games_yielded >= max_games:
                 break
 
-            # Extract ratings from PGN headers
-            white_elo = self._extract_rating(game, "WhiteElo")
-            black_elo = self._extract_rating(game, "BlackElo")
+            # Both Elo tags live in the header block; scan just that with
+            # one combined pass instead of two whole-PGN searches
+            header_blob = game.split("\n\n", 1)[0]
+            ratings = dict(_ELO_RE.findall(header_blob))
 
             # Check if either player meets minimum rating
-            if (white_elo and white_elo >= min_rating) or (black_elo and black_elo >= min_rating):
+            if int(ratings.get("WhiteElo", 0)) >= min_rating or int(ratings.get("BlackElo", 0)) >= min_rating:
                 yield game
                 games_yielded += 1
 
@@ -147,33 +219,13 @@ class TWICClient:
 
     def _split_pgn_content(self, content: str) -> List[str]:
         """Split PGN content into individual games."""
-        games = []
-        current_game = []
-
-        for line in content.splitlines():
-            line = line.strip()
-
-            # Start of new game (Event header)
-            if line.startswith("[Event "):
-                if current_game:
-                    games.append("\n".join(current_game))
-                current_game = [line]
-            elif current_game:
-                current_game.append(line)
-
-        # Don't forget the last game
-        if current_game:
-            games.append("\n".join(current_game))
-
-        return games
+        # One C-level regex pass at Event boundaries replaces the per-line
+        # Python loop; anything before the first header is discarded
+        return [part.strip() for part in _PGN_SPLIT_RE.split(content) if part.startswith("[Event ")]
 
     def _extract_rating(self, pgn: str, rating_tag: str) -> Optional[int]:
         """Extract rating from PGN headers."""
-        pattern = rf'\[{rating_tag}\s+"(\d+)"\]'
-        match = re.search(pattern, pgn)
-        if match:
-            try:
-                return int(match.group(1))
-            except ValueError:
-                pass
-        return None
+        # findall returns the capture strings directly, skipping the
+        # Match-object allocation search would make per game
+        found = _rating_pattern(rating_tag).findall(pgn)
+        return int(found[0]) if found else None
@@ -2,8 +2,9 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -15,8 +16,8 @@ class MetricResult:
     metric_name: str
     cohort1_id: str
     cohort2_id: str
-    cohort1_values: List[float]
-    cohort2_values: List[float]
+    cohort1_values: np.ndarray
+    cohort2_values: np.ndarray
     summary_stats: Dict[str, Any]
     visualization_data: Dict[str, Any]
     raw_data: Dict[str, Any]
@@ -44,7 +45,7 @@ class AbstractMetric(ABC):
         pass
 
     @abstractmethod
-    def calculate_for_cohort(self, cohort_df: pd.DataFrame) -> List[float]:
+    def calculate_for_cohort(self, cohort_df: pd.DataFrame) -> np.ndarray:
         """
         Calculate metric values for all games in a cohort.
 
@@ -52,7 +53,7 @@ class AbstractMetric(ABC):
             cohort_df: DataFrame with analyzed games from a cohort
 
         Returns:
-            List of metric values, one per game or position
+            Array of metric values, one per game or position
         """
         pass
 
@@ -77,11 +78,9 @@ class AbstractMetric(ABC):
     def get_summary_for_cohort(self, cohort_df: pd.DataFrame) -> Dict[str, Any]:
         """Get summary statistics for a single cohort."""
         values = self.calculate_for_cohort(cohort_df)
-        if not values:
+        if len(values) == 0:
             return {"count": 0, "mean": 0, "median": 0}
 
-        import numpy as np
-
         return {
             "count": len(values),
             "mean": float(np.mean(values)),
@@ -1,6 +1,8 @@
 """Pawn blocking (SPBTS) metric implementation."""
 
-from typing import Any, Dict, List
+import ast
+import json
+from typing import Any, Dict
 
 import numpy as np
 import pandas as pd
@@ -8,6 +10,11 @@ import pandas as pd
 from .base import AbstractMetric, MetricResult
 
 
+def _n_unique_players(df: pd.DataFrame) -> int:
+    """Count distinct players across both colors via pandas' C hash table."""
+    return pd.unique(np.concatenate([df["white_player"].to_numpy(), df["black_player"].to_numpy()])).size
+
+
 class PawnBlockingMetric(AbstractMetric):
     """Measures Self-Pawn Block To Start (SPBTS) rates."""
 
@@ -23,19 +30,22 @@ class PawnBlockingMetric(AbstractMetric):
     def description(self) -> str:
         return "Rate at which pawns on starting squares get blocked by friendly non-pawn pieces"
 
-    def calculate_for_cohort(self, cohort_df: pd.DataFrame) -> List[float]:
-        """Extract all SPBTS values from both white and black sides."""
-        values = []
-
-        # Collect white SPBTS values
-        if "white_spbts" in cohort_df.columns:
-            white_values = cohort_df["white_spbts"].dropna().tolist()
-            values.extend(white_values)
-
-        # Collect black SPBTS values
-        if "black_spbts" in cohort_df.columns:
-            black_values = cohort_df["black_spbts"].dropna().tolist()
-            values.extend(black_values)
+    def calculate_for_cohort(self, cohort_df: pd.DataFrame) -> np.ndarray:
+        """Extract all SPBTS values from both white and black sides.
+
+        Returns one contiguous float64 array (NaNs dropped) so downstream
+        stats operate on it directly instead of round-tripping lists.
+        """
+        parts = [
+            cohort_df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in ("white_spbts", "black_spbts")
+            if col in cohort_df.columns
+        ]
+        if parts:
+            values = np.concatenate(parts)
+            values = values[~np.isnan(values)]
+        else:
+            values = np.empty(0, dtype=np.float64)
 
         return values
 
@@ -57,8 +67,8 @@ class PawnBlockingMetric(AbstractMetric):
         raw_data = {
             "cohort1_games": len(cohort1_df),
             "cohort2_games": len(cohort2_df),
-            "cohort1_players": len(set(cohort1_df["white_player"]) | set(cohort1_df["black_player"])),
-            "cohort2_players": len(set(cohort2_df["white_player"]) | set(cohort2_df["black_player"])),
+            "cohort1_players": _n_unique_players(cohort1_df),
+            "cohort2_players": _n_unique_players(cohort2_df),
         }
 
         return MetricResult(
@@ -73,57 +83,80 @@ class PawnBlockingMetric(AbstractMetric):
             raw_data=raw_data,
         )
 
-    def _calculate_comparison_stats(self, values1: List[float], values2: List[float]) -> Dict[str, Any]:
+    def _calculate_comparison_stats(self, values1: np.ndarray, values2: np.ndarray) -> Dict[str, Any]:
         """Calculate statistical comparison between two sets of values."""
-        if not values1 or not values2:
+        if len(values1) == 0 or len(values2) == 0:
             return {"error": "Insufficient data for comparison"}
 
-        arr1 = np.array(values1)
-        arr2 = np.array(values2)
+        arr1 = np.asarray(values1)
+        arr2 = np.asarray(values2)
+
+        # Compute each moment once and reuse it for the summary fields
+        # and the effect size
+        median1, median2 = float(np.median(arr1)), float(np.median(arr2))
+        mean1, mean2 = float(np.mean(arr1)), float(np.mean(arr2))
+        var1, var2 = float(np.var(arr1, ddof=1)), float(np.var(arr2, ddof=1))
 
         return {
-            "cohort1_median": float(np.median(arr1)),
-            "cohort2_median": float(np.median(arr2)),
-            "cohort1_mean": float(np.mean(arr1)),
-            "cohort2_mean": float(np.mean(arr2)),
-            "median_difference": float(np.median(arr1) - np.median(arr2)),
-            "mean_difference": float(np.mean(arr1) - np.mean(arr2)),
+            "cohort1_median": median1,
+            "cohort2_median": median2,
+            "cohort1_mean": mean1,
+            "cohort2_mean": mean2,
+            "median_difference": median1 - median2,
+            "mean_difference": mean1 - mean2,
             "cohort1_std": float(np.std(arr1)),
             "cohort2_std": float(np.std(arr2)),
-            "effect_size": self._calculate_cohens_d(arr1, arr2),
+            "effect_size": self._calculate_cohens_d(mean1, var1, len(arr1), mean2, var2, len(arr2)),
         }
 
-    def _calculate_cohens_d(self, arr1: np.ndarray, arr2: np.ndarray) -> float:
-        """Calculate Cohen's d effect size."""
+    @staticmethod
+    def _calculate_cohens_d(mean1: float, var1: float, n1: int, mean2: float, var2: float, n2: int) -> float:
+        """Calculate Cohen's d from precomputed sample means and variances (ddof=1)."""
         try:
-            pooled_std = np.sqrt(
-                ((len(arr1) - 1) * np.var(arr1) + (len(arr2) - 1) * np.var(arr2)) / (len(arr1) + len(arr2) - 2)
-            )
-            return float((np.mean(arr1) - np.mean(arr2)) / pooled_std)
+            pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+            return float((mean1 - mean2) / pooled_std)
         except (ZeroDivisionError, ValueError):
             return 0.0
 
+    @staticmethod
+    def _coerce_fates(value: Any):
+        """Normalize a fates cell to a dict (JSON round-trips give strings)."""
+        if isinstance(value, dict):
+            return value
+        if isinstance(value, str):
+            # Fate dicts are str keys to int counts, so swapping quotes
+            # turns the Python repr into JSON; json.loads skips the AST
+            # compiler. Fall back to literal_eval for anything odd.
+            try:
+                parsed = json.loads(value.replace("'", '"'))
+            except ValueError:
+                try:
+                    parsed = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    return None
+            return parsed if isinstance(parsed, dict) else None
+        return None
+
     def _prepare_visualization_data(
         self, cohort1_df: pd.DataFrame, cohort2_df: pd.DataFrame, cohort1_id: str, cohort2_id: str
     ) -> Dict[str, Any]:
         """Prepare data needed for visualizations."""
         viz_data = {"cohort_names": {cohort1_id: cohort1_id, cohort2_id: cohort2_id}, "per_file_data": {}}
 
-        # Extract per-file blocking rates for heatmaps
+        # Extract per-file blocking rates for heatmaps; nanmean over the
+        # raw column buffers replaces 16 dropna/tolist copies per cohort
         for cohort_df, cohort_id in [(cohort1_df, cohort1_id), (cohort2_df, cohort2_id)]:
             file_data = {}
             for file_letter in "abcdefgh":
-                white_col = f"white_{file_letter}"
-                black_col = f"black_{file_letter}"
-
-                values = []
-                if white_col in cohort_df.columns:
-                    values.extend(cohort_df[white_col].dropna().tolist())
-                if black_col in cohort_df.columns:
-                    values.extend(cohort_df[black_col].dropna().tolist())
-
-                if values:
-                    file_data[file_letter] = np.mean(values)
+                arrays = [
+                    cohort_df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    for col in (f"white_{file_letter}", f"black_{file_letter}")
+                    if col in cohort_df.columns
+                ]
+
+                if arrays:
+                    combined = np.concatenate(arrays)
+                    file_data[file_letter] = float(np.nanmean(combined)) if np.isfinite(combined).any() else 0.0
                 else:
                     file_data[file_letter] = 0.0
 
@@ -142,39 +175,20 @@ class PawnBlockingMetric(AbstractMetric):
                 "permanent_block": 0,
             }
 
-            # Combine fates from both white and black columns
+            # Combine fates from both white and black columns; column-wise
+            # sums replace the old per-row iterrows accumulation
             for color_prefix in ["white", "black"]:
                 fate_col = f"{color_prefix}_f_pawn_fates"
-                if fate_col in cohort_df.columns:
-                    for row_idx, row in cohort_df.iterrows():
-                        fates = row[fate_col]
-                        if fates:
-                            # Handle both dict and string representations
-                            if isinstance(fates, str):
-                                try:
-                                    import ast
-
-                                    fates = ast.literal_eval(fates)
-                                except (ValueError, SyntaxError):
-                                    print(f"DEBUG: Parse error on row {row_idx}: {fates}")
-                                    continue
-                            elif not isinstance(fates, dict):
-                                print(f"DEBUG: Row {row_idx} has unexpected type {type(fates)}: {fates}")
-                                continue
-
-                            # Check if all expected keys are present
-                            missing_keys = set(aggregated_fates.keys()) - set(fates.keys())
-                            if missing_keys:
-                                print(f"DEBUG: Row {row_idx} missing keys: {missing_keys}")
-                                print(f"DEBUG: Row {row_idx} has keys: {list(fates.keys())}")
-                                # Add missing keys with 0 count
-                                for key in missing_keys:
-                                    fates[key] = 0
-
-                            # Now we have a dict with all keys
-                            for fate, count in fates.items():
-                                if fate in aggregated_fates:
-                                    aggregated_fates[fate] += count
+                if fate_col not in cohort_df.columns:
+                    continue
+
+                fates = cohort_df[fate_col].dropna().map(self._coerce_fates).dropna()
+                if fates.empty:
+                    continue
+
+                totals = pd.DataFrame(fates.tolist()).sum()
+                for fate in aggregated_fates:
+                    aggregated_fates[fate] += int(totals.get(fate, 0))
 
             viz_data["f_pawn_fates"][cohort_id] = aggregated_fates
 
@@ -1,6 +1,6 @@
 """Registry for available chess game metrics."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from .base import AbstractMetric
 from .pawn_blocking import PawnBlockingMetric
@@ -11,6 +11,10 @@ class MetricRegistry:
 
     def __init__(self):
         self._metrics: Dict[str, AbstractMetric] = {}
+        # Metadata snapshots served to UI code on every rerun; rebuilt
+        # lazily after register()
+        self._metrics_cache: Optional[Tuple[AbstractMetric, ...]] = None
+        self._ids_cache: Optional[Tuple[str, ...]] = None
         self._register_builtin_metrics()
 
     def _register_builtin_metrics(self):
@@ -21,20 +25,27 @@ class MetricRegistry:
     def register(self, metric: AbstractMetric):
         """Register a new metric."""
         self._metrics[metric.metric_id] = metric
+        self._metrics_cache = None
+        self._ids_cache = None
 
     def get_metric(self, metric_id: str) -> AbstractMetric:
         """Get a metric by ID."""
-        if metric_id not in self._metrics:
-            raise ValueError(f"Unknown metric: {metric_id}")
-        return self._metrics[metric_id]
+        try:
+            return self._metrics[metric_id]
+        except KeyError:
+            raise ValueError(f"Unknown metric: {metric_id}") from None
 
     def list_metrics(self) -> List[AbstractMetric]:
         """Get all available metrics."""
-        return list(self._metrics.values())
+        if self._metrics_cache is None:
+            self._metrics_cache = tuple(self._metrics.values())
+        return list(self._metrics_cache)
 
     def get_metric_ids(self) -> List[str]:
         """Get all metric IDs."""
-        return list(self._metrics.keys())
+        if self._ids_cache is None:
+            self._ids_cache = tuple(self._metrics.keys())
+        return list(self._ids_cache)
 
     def get_default_metric_id(self) -> str:
         """Get the default metric for analysis."""
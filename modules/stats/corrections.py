@@ -26,16 +26,10 @@ def holm_correction(p_values: List[float], alpha: float = 0.05) -> Dict:
     sorted_indices = np.argsort(p_values)
     sorted_p = p_values[sorted_indices]
 
-    # Apply Holm correction (step-down)
-    adjusted_p = np.zeros_like(sorted_p)
-    running_max = 0.0
-
-    for i, p in enumerate(sorted_p):
-        # Holm adjustment: multiply by (m - i) where m is total tests
-        holm_adjusted = min(1.0, (n - i) * p)
-        # Ensure monotonicity (adjusted p-values don't decrease)
-        running_max = max(running_max, holm_adjusted)
-        adjusted_p[i] = running_max
+    # Apply Holm correction (step-down): scale by (m - i), then enforce
+    # monotonicity with a cumulative maximum - both as single array ops
+    holm_adjusted = np.minimum(1.0, (n - np.arange(n)) * sorted_p)
+    adjusted_p = np.maximum.accumulate(holm_adjusted)
 
     # Map back to original order
     final_adjusted = np.zeros_like(p_values)
@@ -73,14 +67,10 @@ def benjamini_hochberg_correction(p_values: List[float], alpha: float = 0.05) ->
     sorted_indices = np.argsort(p_values)
     sorted_p = p_values[sorted_indices]
 
-    # Apply BH correction
-    adjusted_p = np.zeros_like(sorted_p)
-    for i, p in enumerate(sorted_p):
-        adjusted_p[i] = min(1.0, p * n / (i + 1))
-
-    # Ensure monotonicity (step-up procedure)
-    for i in range(n - 2, -1, -1):
-        adjusted_p[i] = min(adjusted_p[i], adjusted_p[i + 1])
+    # Apply BH correction, then enforce the step-up monotonicity with a
+    # reversed cumulative minimum - both as single array ops
+    adjusted_p = np.minimum(1.0, sorted_p * n / np.arange(1, n + 1))
+    adjusted_p = np.minimum.accumulate(adjusted_p[::-1])[::-1]
 
     # Map back to original order
     final_adjusted = np.zeros_like(p_values)
@@ -10,13 +10,13 @@ from .corrections import holm_correction
 
 
 def wilcoxon_test(
-    group1_values: List[float], group2_values: List[float], alternative: str = "two-sided"
+    group1_values: np.ndarray, group2_values: np.ndarray, alternative: str = "two-sided"
 ) -> Tuple[float, float]:
     """
     Perform Wilcoxon signed-rank test on paired data.
 
     Args:
-        group1_values: First group values
+        group1_values: First group values (array-like)
         group2_values: Second group values (must be same length)
         alternative: "two-sided", "less", or "greater"
 
@@ -61,6 +61,7 @@ def per_file_analysis(
     files = "abcdefgh"
     results = []
     p_values = []
+    p_rows = []  # Result-row index for each tested file
 
     for file_letter in files:
         col1 = f"{group1_prefix}_{file_letter}"
@@ -84,15 +85,18 @@ def per_file_analysis(
                 "significant": False,
             }
         else:
-            vals1 = df.loc[mask, col1]
-            vals2 = df.loc[mask, col2]
+            # Pass the raw buffers straight to scipy; the paired masks
+            # differ per file, so this stays a per-file call
+            vals1 = df.loc[mask, col1].to_numpy(dtype=np.float64)
+            vals2 = df.loc[mask, col2].to_numpy(dtype=np.float64)
 
-            median1 = vals1.median()
-            median2 = vals2.median()
+            median1 = float(np.median(vals1))
+            median2 = float(np.median(vals2))
             diff = median1 - median2
 
-            stat, p_val = wilcoxon_test(vals1.tolist(), vals2.tolist(), alternative)
+            stat, p_val = wilcoxon_test(vals1, vals2, alternative)
             p_values.append(p_val)
+            p_rows.append(len(results))
 
             result = {
                 "file": file_letter,
@@ -108,18 +112,24 @@ def per_file_analysis(
 
     results_df = pd.DataFrame(results)
 
-    # Apply multiple comparison correction
+    # Apply multiple comparison correction; build the corrected columns as
+    # arrays and assign once instead of per-cell .at writes
     if apply_correction and p_values:
-        finite_p_values = [(i, p) for i, p in enumerate(p_values) if np.isfinite(p)]
+        p_arr = np.asarray(p_values, dtype=float)
+        row_arr = np.asarray(p_rows)
+        finite = np.isfinite(p_arr)
+
+        if finite.any():
+            corrected = holm_correction(p_arr[finite].tolist(), alpha)
 
-        if finite_p_values:
-            corrected = holm_correction([p for _, p in finite_p_values], alpha)
+            p_adjusted = np.full(len(results_df), np.nan)
+            significant = np.zeros(len(results_df), dtype=bool)
+            rows = row_arr[finite]
+            p_adjusted[rows] = corrected["adjusted_p"]
+            significant[rows] = corrected["significant"]
 
-            for (original_idx, _), corrected_p, is_sig in zip(
-                finite_p_values, corrected["adjusted_p"], corrected["significant"]
-            ):
-                results_df.at[original_idx, "p_adjusted"] = corrected_p
-                results_df.at[original_idx, "significant"] = is_sig
+            results_df["p_adjusted"] = p_adjusted
+            results_df["significant"] = significant
 
     return results_df
 
@@ -4,6 +4,12 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+# Placeholder template for the no-data case, validated once at import;
+# callers get a cheap copy so mutating a returned figure can't leak into
+# later empty-chart responses
+_EMPTY_FIG = go.Figure()
+_EMPTY_FIG.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+
 
 def line_chart(df: pd.DataFrame, metric: str, color: str = "#1f77b4") -> go.Figure:
     """
@@ -18,10 +24,7 @@ def line_chart(df: pd.DataFrame, metric: str, color: str = "#1f77b4") -> go.Figu
         Plotly figure object
     """
     if df.empty or metric not in df.columns:
-        # Return empty chart
-        fig = go.Figure()
-        fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        return fig
+        return go.Figure(_EMPTY_FIG)
 
     fig = px.line(df, x=df.columns[0], y=metric, title=f"{metric} over time")  # Assume first column is x-axis
 
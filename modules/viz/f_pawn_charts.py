@@ -1,72 +1,99 @@
 """F-pawn fate visualization charts."""
 
+from collections import OrderedDict
 from typing import Dict, List
 
+import numpy as np
+import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
 
+# The builders are cached so Streamlit reruns triggered by unrelated
+# widgets reuse the assembled figure instead of rebuilding and
+# re-serializing it; dicts are keyed by their sorted items
+_HASH_FUNCS = {dict: lambda d: tuple(sorted(d.items()))}
+
+# Meaningful labels and colors (ordered from most flexible to most blocked).
+# This order determines the stacking order - most blocked appears at top.
+_FATE_INFO = OrderedDict(
+    [
+        ("never_blocked", {"label": "Never blocked", "color": "#2E8B57"}),  # Sea green - most flexible
+        ("capture", {"label": "Capture", "color": "#2ca02c"}),  # Green - active play
+        ("push_one", {"label": "Push one square", "color": "#1f77b4"}),  # Blue - stays flexible
+        ("push_two", {"label": "Push two squares", "color": "#ff7f0e"}),  # Orange - commits heavily
+        ("temporary_block", {"label": "Temporary block", "color": "#9467bd"}),  # Purple
+        ("permanent_block", {"label": "Permanent block", "color": "#8c564b"}),  # Brown - most restrictive at top
+    ]
+)
+
+# Raw fate keys feeding each simplified category, aligned with _FATE_INFO
+_RAW_KEY_GROUPS = (
+    ("never_blocked",),
+    ("capture_e3", "capture_g3"),
+    ("push_f3",),
+    ("push_f4",),
+    ("temporary_block",),
+    ("permanent_block",),
+)
+
+
+def _fate_percentages(raw_fates: Dict[str, int]) -> "tuple[np.ndarray, int]":
+    """Collapse raw fate counts into _FATE_INFO-ordered percentages."""
+    counts = np.fromiter(
+        (sum(raw_fates.get(k, 0) for k in group) for group in _RAW_KEY_GROUPS),
+        dtype=np.int64,
+        count=len(_RAW_KEY_GROUPS),
+    )
+    total = int(counts.sum())
+    return counts * (100.0 / (total or 1)), total
+
+
 def plot_f_pawn_fates_stacked(
     cohort1_fates: Dict[str, int], cohort2_fates: Dict[str, int], cohort1_name: str, cohort2_name: str
 ) -> None:
     """Create 100% stacked bar chart showing F-pawn fate distributions."""
-
-    # Define meaningful labels and colors (ordered from most flexible to most blocked)
-    # This order determines the stacking order - most blocked will appear at top of chart
-    from collections import OrderedDict
-
-    fate_info = OrderedDict(
-        [
-            ("never_blocked", {"label": "Never blocked", "color": "#2E8B57"}),  # Sea green - most flexible
-            ("capture", {"label": "Capture", "color": "#2ca02c"}),  # Green - active play
-            ("push_one", {"label": "Push one square", "color": "#1f77b4"}),  # Blue - stays flexible
-            ("push_two", {"label": "Push two squares", "color": "#ff7f0e"}),  # Orange - commits heavily
-            ("temporary_block", {"label": "Temporary block", "color": "#9467bd"}),  # Purple
-            ("permanent_block", {"label": "Permanent block", "color": "#8c564b"}),  # Brown - most restrictive at top
-        ]
+    st.plotly_chart(
+        _build_fates_stacked(cohort1_fates, cohort2_fates, cohort1_name, cohort2_name), use_container_width=True
     )
 
-    # Calculate percentages
-    total1 = sum(cohort1_fates.values()) or 1
-    total2 = sum(cohort2_fates.values()) or 1
-
-    fig = go.Figure()
 
-    # Convert raw fates to simplified categories
-    def simplify_fates(raw_fates):
-        return {
-            "never_blocked": raw_fates.get("never_blocked", 0),
-            "push_one": raw_fates.get("push_f3", 0),
-            "push_two": raw_fates.get("push_f4", 0),
-            "capture": raw_fates.get("capture_e3", 0) + raw_fates.get("capture_g3", 0),
-            "temporary_block": raw_fates.get("temporary_block", 0),
-            "permanent_block": raw_fates.get("permanent_block", 0),
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def _build_fates_stacked(
+    cohort1_fates: Dict[str, int], cohort2_fates: Dict[str, int], cohort1_name: str, cohort2_name: str
+) -> go.Figure:
+    """Assemble the stacked fate-distribution figure."""
+
+    # Collapse raw counts into _FATE_INFO-ordered percentage arrays
+    pcts1, total1 = _fate_percentages(cohort1_fates)
+    pcts2, total2 = _fate_percentages(cohort2_fates)
+    total1 = total1 or 1
+    total2 = total2 or 1
+
+    # Long-form frame so px.bar builds all six stacked traces in one
+    # call instead of six validated add_trace invocations
+    pcts = np.concatenate([pcts1, pcts2])
+    labels = [info["label"] for info in _FATE_INFO.values()]
+    chart_df = pd.DataFrame(
+        {
+            "cohort": [cohort1_name] * len(_FATE_INFO) + [cohort2_name] * len(_FATE_INFO),
+            "fate": labels * 2,
+            "pct": pcts,
+            "text": [f"{pct:.1f}%" if pct > 0 else "" for pct in pcts],
         }
+    )
 
-    simplified_fates1 = simplify_fates(cohort1_fates)
-    simplified_fates2 = simplify_fates(cohort2_fates)
-
-    # Recalculate totals with simplified data
-    total1 = sum(simplified_fates1.values()) or 1
-    total2 = sum(simplified_fates2.values()) or 1
-
-    # Add traces for each fate category
-    for fate, info in fate_info.items():
-        pct1 = 100 * simplified_fates1[fate] / total1
-        pct2 = 100 * simplified_fates2[fate] / total2
-
-        fig.add_trace(
-            go.Bar(
-                name=info["label"],
-                x=[cohort1_name, cohort2_name],
-                y=[pct1, pct2],
-                marker_color=info["color"],
-                text=[f"{pct1:.1f}%" if pct1 > 0 else "", f"{pct2:.1f}%" if pct2 > 0 else ""],
-                textposition="inside",
-                textfont=dict(color="white", size=12),
-            )
-        )
+    fig = px.bar(
+        chart_df,
+        x="cohort",
+        y="pct",
+        color="fate",
+        text="text",
+        color_discrete_map={info["label"]: info["color"] for info in _FATE_INFO.values()},
+        category_orders={"fate": labels},
+    )
+    fig.update_traces(textposition="inside", textfont=dict(color="white", size=12))
 
     fig.update_layout(
         title=f"F-pawn Fate Distribution (n={total1}, n={total2})",
@@ -74,17 +101,27 @@ def plot_f_pawn_fates_stacked(
         yaxis_title="Percentage (%)",
         barmode="stack",
         height=600,
-        legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.02),
+        legend=dict(title=None, orientation="v", yanchor="top", y=1, xanchor="left", x=1.02),
         yaxis=dict(range=[0, 100]),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def plot_f_pawn_fates_bar(
     cohort1_fates: Dict[str, int], cohort2_fates: Dict[str, int], cohort1_name: str, cohort2_name: str
 ) -> None:
     """Create a comparative bar chart showing F-pawn fate distributions."""
+    st.plotly_chart(
+        _build_fates_bar(cohort1_fates, cohort2_fates, cohort1_name, cohort2_name), use_container_width=True
+    )
+
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def _build_fates_bar(
+    cohort1_fates: Dict[str, int], cohort2_fates: Dict[str, int], cohort1_name: str, cohort2_name: str
+) -> go.Figure:
+    """Assemble the grouped fate-comparison figure."""
 
     fate_labels = {
         "push_f3": "Push to f3",
@@ -123,4 +160,4 @@ def plot_f_pawn_fates_bar(
         xaxis={"tickangle": 45},
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
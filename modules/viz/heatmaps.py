@@ -4,11 +4,75 @@ from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 
 from ..core.board_analysis import FILES
 
+# Only ranks 3 and 6 ever carry data - the squares directly ahead of the
+# starting pawns - so the builders fill those two rows of a full 8x8 grid
+# and leave the rest NaN, which renders as background with hover
+# suppressed. The z has to stay 8 rows tall: with just two y values
+# Plotly infers brick edges from coordinate spacing and draws each data
+# row three ranks high
+_DATA_ROWS = (2, 5)  # 0-based rows for ranks 3 and 6
+
+
+def _rates_array(data) -> np.ndarray:
+    """File-ordered rates as float64; accepts an a-h dict or a ready (8,) array."""
+    if isinstance(data, np.ndarray):
+        return np.asarray(data, dtype=np.float64)
+    return np.fromiter((data.get(f, 0.0) for f in FILES), dtype=np.float64, count=8)
+
+# Static layout pieces shared by every figure these builders produce,
+# assembled once at import so each call skips re-validating them
+_GRID_LINE = dict(color="gray", width=1, dash="solid")
+
+# 9 vertical + 9 horizontal lines outlining the 8x8 squares
+# (files at x 0-7, ranks at y 1-8 so %{y} hovers read as the rank)
+_GRID_SHAPES = tuple(
+    dict(type="line", x0=i - 0.5, x1=i - 0.5, y0=0.5, y1=8.5, line=_GRID_LINE, layer="below") for i in range(9)
+) + tuple(
+    dict(type="line", x0=-0.5, x1=7.5, y0=i + 0.5, y1=i + 0.5, line=_GRID_LINE, layer="below") for i in range(9)
+)
+
+_DELTA_LAYOUT = dict(
+    xaxis_title="File",
+    yaxis_title="Rank",
+    width=600,
+    height=600,
+    xaxis=dict(tickmode="array", tickvals=list(range(8)), ticktext=list(FILES), side="bottom"),
+    yaxis=dict(tickmode="array", tickvals=list(range(1, 9)), ticktext=list(range(1, 9)), range=[0.5, 8.5]),
+)
+
+_SINGLE_LAYOUT = dict(
+    xaxis_title="File",
+    yaxis_title="Rank",
+    width=400,  # Square dimensions
+    height=450,  # Slightly taller to account for title/labels
+    margin=dict(l=50, r=50, t=80, b=50),  # Consistent margins
+    xaxis=dict(
+        tickmode="array",
+        tickvals=list(range(8)),
+        ticktext=list(FILES),
+        side="bottom",
+        showgrid=False,  # Turn off built-in grid
+        range=[-0.5, 7.5],  # Exact range for 8 squares
+        fixedrange=True,  # Prevent zooming
+    ),
+    yaxis=dict(
+        tickmode="array",
+        tickvals=list(range(1, 9)),
+        ticktext=list(range(1, 9)),
+        showgrid=False,  # Turn off built-in grid
+        range=[0.5, 8.5],  # Exact range for 8 squares
+        scaleanchor="x",  # Force equal aspect ratio
+        scaleratio=1,
+        fixedrange=True,  # Prevent zooming
+    ),
+    plot_bgcolor="white",
+    shapes=_GRID_SHAPES,  # Explicit grid lines to make chess squares visible
+)
+
 
 def create_delta_heatmap(
     group1_data: Dict[str, float],
@@ -21,8 +85,8 @@ def create_delta_heatmap(
     Create a chess board heatmap showing difference in blocking rates.
 
     Args:
-        group1_data: Dictionary with file -> blocking_rate for group 1
-        group2_data: Dictionary with file -> blocking_rate for group 2
+        group1_data: File -> blocking_rate dict (or file-ordered array) for group 1
+        group2_data: File -> blocking_rate dict (or file-ordered array) for group 2
         title: Plot title
         group1_name: Name of first group
         group2_name: Name of second group
@@ -30,63 +94,44 @@ def create_delta_heatmap(
     Returns:
         Plotly figure object
     """
-    # Create 8x8 board (White's perspective: rank 1 at bottom)
-    board = np.zeros((8, 8))
-    hover_text = [[""] * 8 for _ in range(8)]
-
-    for i, file_letter in enumerate(FILES):
-        rate1 = group1_data.get(file_letter, 0.0)
-        rate2 = group2_data.get(file_letter, 0.0)
-        difference = rate2 - rate1  # Group2 - Group1
-
-        # Only squares a3-h3 (rank index 2) and a6-h6 (rank index 5) can have values
-        # These are the squares directly ahead of starting pawn positions
-
-        # White pawn ahead squares (rank 3)
-        board[2, i] = difference
-        hover_text[2][i] = (
-            f"{file_letter}3<br>"
-            f"{group1_name}: {rate1:.3f}<br>"
-            f"{group2_name}: {rate2:.3f}<br>"
-            f"Difference: {difference:+.3f}"
-        )
+    # Gather the per-file rates once; both data ranks carry the same values
+    rates1 = _rates_array(group1_data)
+    rates2 = _rates_array(group2_data)
+    diff = rates2 - rates1  # Group2 - Group1
 
-        # Black pawn ahead squares (rank 6)
-        board[5, i] = difference
-        hover_text[5][i] = (
-            f"{file_letter}6<br>"
-            f"{group1_name}: {rate1:.3f}<br>"
-            f"{group2_name}: {rate2:.3f}<br>"
-            f"Difference: {difference:+.3f}"
-        )
+    z = np.full((8, 8), np.nan)
+    z[list(_DATA_ROWS), :] = diff
+
+    # Per-cell group rates travel as numeric customdata and one shared
+    # hovertemplate; Plotly formats at hover time instead of Python
+    # pre-building a string per cell
+    customdata = np.broadcast_to(np.stack([rates1, rates2], axis=-1), (8, 8, 2))
 
     # Find color scale limits
-    max_abs = np.max(np.abs(board[np.nonzero(board)])) if np.any(board) else 1.0
+    max_abs = np.abs(diff).max() if np.any(diff) else 1.0
 
     fig = go.Figure(
         data=go.Heatmap(
-            z=board,
+            z=z,
             x=list(FILES),
             y=list(range(1, 9)),
             colorscale="RdBu",
             zmid=0,
             zmin=-max_abs,
             zmax=max_abs,
-            hovertemplate="%{text}<extra></extra>",
-            text=hover_text,
+            customdata=customdata,
+            hovertemplate=(
+                "%{x}%{y}<br>"
+                f"{group1_name}: %{{customdata[0]:.3f}}<br>"
+                f"{group2_name}: %{{customdata[1]:.3f}}<br>"
+                "Difference: %{z:+.3f}<extra></extra>"
+            ),
+            hoverongaps=False,
             colorbar=dict(title=f"Rate Difference<br>({group2_name} - {group1_name})"),
         )
     )
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="File",
-        yaxis_title="Rank",
-        width=600,
-        height=600,
-        xaxis=dict(tickmode="array", tickvals=list(range(8)), ticktext=list(FILES), side="bottom"),
-        yaxis=dict(tickmode="array", tickvals=list(range(8)), ticktext=list(range(1, 9)), autorange=True),
-    )
+    fig.update_layout(title=title, **_DELTA_LAYOUT)
 
     return fig
 
@@ -109,23 +154,20 @@ def create_per_file_comparison_chart(
     Returns:
         Plotly figure object
     """
-    files = []
-    group1_rates = []
-    group2_rates = []
+    # One vectorized median pass per group instead of masked per-file
+    # reductions; median() already skips NaNs, count() tells us which
+    # files have data for both groups
+    present = [f for f in FILES if f"{group1_prefix}_{f}" in df.columns and f"{group2_prefix}_{f}" in df.columns]
+    cols1 = [f"{group1_prefix}_{f}" for f in present]
+    cols2 = [f"{group2_prefix}_{f}" for f in present]
 
-    for file_letter in FILES:
-        col1 = f"{group1_prefix}_{file_letter}"
-        col2 = f"{group2_prefix}_{file_letter}"
+    medians1 = df[cols1].median()
+    medians2 = df[cols2].median()
+    has_data = (df[cols1].count().to_numpy() > 0) & (df[cols2].count().to_numpy() > 0)
 
-        if col1 in df.columns and col2 in df.columns:
-            # Calculate median rates
-            mask1 = df[col1].notna()
-            mask2 = df[col2].notna()
-
-            if mask1.sum() > 0 and mask2.sum() > 0:
-                files.append(file_letter)
-                group1_rates.append(df.loc[mask1, col1].median())
-                group2_rates.append(df.loc[mask2, col2].median())
+    files = [f for f, keep in zip(present, has_data) if keep]
+    group1_rates = medians1.to_numpy()[has_data].tolist()
+    group2_rates = medians2.to_numpy()[has_data].tolist()
 
     fig = go.Figure()
 
@@ -151,7 +193,7 @@ def create_single_heatmap(
     Create a single chess board heatmap showing blocking rates.
 
     Args:
-        file_data: Dictionary with file -> blocking_rate
+        file_data: File -> blocking_rate dict (or file-ordered array)
         title: Plot title
         player_name: Player name for hover text
         vmin: Minimum value for color scale
@@ -160,23 +202,11 @@ def create_single_heatmap(
     Returns:
         Plotly figure object
     """
-    # Create 8x8 board (White's perspective: rank 1 at bottom)
-    board = np.zeros((8, 8))
-    hover_text = [[""] * 8 for _ in range(8)]
-
-    for i, file_letter in enumerate(FILES):
-        rate = file_data.get(file_letter, 0.0)
+    # Both data ranks carry the same per-file rate
+    rates = _rates_array(file_data)
 
-        # Only squares a3-h3 (rank index 2) and a6-h6 (rank index 5) can have values
-        # These are the squares directly ahead of starting pawn positions
-
-        # White pawn ahead squares (rank 3)
-        board[2, i] = rate
-        hover_text[2][i] = f"{file_letter}3<br>" f"{player_name}: {rate:.3f}"
-
-        # Black pawn ahead squares (rank 6)
-        board[5, i] = rate
-        hover_text[5][i] = f"{file_letter}6<br>" f"{player_name}: {rate:.3f}"
+    z = np.full((8, 8), np.nan)
+    z[list(_DATA_ROWS), :] = rates
 
     # Use provided scale or calculate from data
     if vmin is None:
@@ -185,74 +215,24 @@ def create_single_heatmap(
         min_val = vmin
 
     if vmax is None:
-        max_val = np.max(board) if np.any(board) else 1.0
+        max_val = np.max(rates) if np.any(rates) else 1.0
     else:
         max_val = vmax
 
     fig = go.Figure(
         data=go.Heatmap(
-            z=board,
+            z=z,
             x=list(FILES),
             y=list(range(1, 9)),
             colorscale="Blues",  # Single color scale instead of diverging
             zmin=min_val,
             zmax=max_val,
-            hovertemplate="%{text}<extra></extra>",
-            text=hover_text,
+            hovertemplate="%{x}%{y}<br>" + player_name + ": %{z:.3f}<extra></extra>",
+            hoverongaps=False,
             colorbar=dict(title="Blocking Rate"),
         )
     )
 
-    fig.update_layout(
-        title=dict(text=title, x=0.5),  # Center the title
-        xaxis_title="File",
-        yaxis_title="Rank",
-        width=400,  # Square dimensions
-        height=450,  # Slightly taller to account for title/labels
-        margin=dict(l=50, r=50, t=80, b=50),  # Consistent margins
-        xaxis=dict(
-            tickmode="array",
-            tickvals=list(range(8)),
-            ticktext=list(FILES),
-            side="bottom",
-            showgrid=False,  # Turn off built-in grid
-            range=[-0.5, 7.5],  # Exact range for 8 squares
-            fixedrange=True,  # Prevent zooming
-        ),
-        yaxis=dict(
-            tickmode="array",
-            tickvals=list(range(8)),
-            ticktext=list(range(1, 9)),
-            showgrid=False,  # Turn off built-in grid
-            range=[-0.5, 7.5],  # Exact range for 8 squares
-            scaleanchor="x",  # Force equal aspect ratio
-            scaleratio=1,
-            fixedrange=True,  # Prevent zooming
-        ),
-        plot_bgcolor="white",
-    )
-
-    # Add explicit grid lines to make chess squares visible
-    for i in range(9):  # 9 lines for 8 squares
-        # Vertical lines
-        fig.add_shape(
-            type="line",
-            x0=i - 0.5,
-            x1=i - 0.5,
-            y0=-0.5,
-            y1=7.5,
-            line=dict(color="gray", width=1, dash="solid"),
-            layer="below",
-        )
-        # Horizontal lines
-        fig.add_shape(
-            type="line",
-            x0=-0.5,
-            x1=7.5,
-            y0=i - 0.5,
-            y1=i - 0.5,
-            line=dict(color="gray", width=1, dash="solid"),
-            layer="below",
-        )
+    fig.update_layout(title=dict(text=title, x=0.5), **_SINGLE_LAYOUT)  # Centered title over shared layout
 
     return fig
@@ -5,6 +5,22 @@ from typing import Dict
 import numpy as np
 import plotly.graph_objects as go
 
+# Shared blank board; copying it is a single memcpy per call
+_ZERO_BOARD = np.zeros((8, 8))
+
+# Static layout assembled once at import; only the title varies per call
+_BOARD_LAYOUT = dict(
+    width=400,
+    height=400,
+    xaxis=dict(tickvals=list(range(8)), ticktext=list("abcdefgh"), side="bottom", title="File"),
+    yaxis=dict(
+        tickvals=list(range(8)),
+        ticktext=["1", "2", "3", "4", "5", "6", "7", "8"],  # 1 at bottom, 8 at top
+        title="Rank",
+    ),
+    margin=dict(l=60, r=100, t=60, b=60),
+)
+
 
 def create_simple_board_heatmap(
     file_data: Dict[str, float], title: str = "Blocking Rates", vmin: float = 0.0, vmax: float = 1.0
@@ -21,42 +37,24 @@ def create_simple_board_heatmap(
     Returns:
         Plotly figure
     """
-    # Create empty 8x8 board
-    board = np.zeros((8, 8))
-
-    # Fill in data for ranks 3 and 6
-    # Since we display 8,7,6,5,4,3,2,1 from top to bottom:
-    # - Rank 6 is at array index 2 (3rd row from top)
-    # - Rank 3 is at array index 5 (6th row from top)
-    for i, file_letter in enumerate("abcdefgh"):
-        rate = file_data.get(file_letter, 0.0)
-        board[2, i] = rate  # Rank 6 (black pawns ahead) - 3rd row from top
-        board[5, i] = rate  # Rank 3 (white pawns ahead) - 6th row from top
+    # Create empty 8x8 board, row 0 = rank 1 (matches the y-axis labels,
+    # so no flip is needed before plotting)
+    board = _ZERO_BOARD.copy()
 
-    # Debug: print the board to see what we're sending
-    print("Board being sent to heatmap:")
-    for i, row in enumerate(board):
-        rank = 8 - i  # Convert array index to rank number
-        print(f"Array row {i} (Rank {rank}): {row}")
+    # Fill in data for ranks 3 and 6 - the squares ahead of the starting
+    # pawns; both ranks carry the same per-file rate
+    rates = np.fromiter((file_data.get(f, 0.0) for f in "abcdefgh"), dtype=np.float64, count=8)
+    board[[2, 5], :] = rates  # Rank 3 (white pawns ahead), rank 6 (black pawns ahead)
 
-    # Try flipping the board vertically to force correct orientation
-    board_flipped = np.flipud(board)
+    # Create custom hover text in one pass over the board
+    hover_text = [
+        [f"File {f}, Rank {row_idx + 1}<br>Rate: {rate:.3f}" for f, rate in zip("abcdefgh", row)]
+        for row_idx, row in enumerate(board)
+    ]
 
-    # Create custom hover text
-    hover_text = []
-    for row_idx in range(8):
-        hover_row = []
-        for col_idx in range(8):
-            file_letter = "abcdefgh"[col_idx]
-            rank_number = row_idx + 1  # Now row 0 = rank 1, row 7 = rank 8
-            rate = board_flipped[row_idx, col_idx]
-            hover_row.append(f"File {file_letter}, Rank {rank_number}<br>Rate: {rate:.3f}")
-        hover_text.append(hover_row)
-
-    # Create the heatmap with flipped board
     fig = go.Figure(
         data=go.Heatmap(
-            z=board_flipped,
+            z=board,
             colorscale="Blues",
             zmin=vmin,
             zmax=vmax,
@@ -67,17 +65,6 @@ def create_simple_board_heatmap(
     )
 
     # Configure layout for exact square
-    fig.update_layout(
-        title=title,
-        width=400,
-        height=400,
-        xaxis=dict(tickvals=list(range(8)), ticktext=list("abcdefgh"), side="bottom", title="File"),
-        yaxis=dict(
-            tickvals=list(range(8)),
-            ticktext=["1", "2", "3", "4", "5", "6", "7", "8"],  # Now 1 at bottom, 8 at top
-            title="Rank",
-        ),
-        margin=dict(l=60, r=100, t=60, b=60),
-    )
+    fig.update_layout(title=title, **_BOARD_LAYOUT)
 
     return fig
@@ -5,6 +5,8 @@ import argparse
 import sys
 from pathlib import Path
 
+import pandas as pd
+
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -72,13 +74,19 @@ def main():
             print("No cohorts found")
             return 0
 
-        print(f"{'ID':<20} {'Name':<30} {'Type':<15} {'Target':<8} {'Tags'}")
-        print("-" * 80)
-        for cohort in sorted(cohorts, key=lambda c: c.priority, reverse=True):
-            tags_str = ", ".join(cohort.tags[:3])  # Show first 3 tags
-            if len(cohort.tags) > 3:
-                tags_str += "..."
-            print(f"{cohort.id:<20} {cohort.name:<30} {cohort.type.value:<15} {cohort.target_games:<8} {tags_str}")
+        # Let pandas handle column alignment instead of hand-built padding
+        table = pd.DataFrame(
+            {
+                "ID": cohort.id,
+                "Name": cohort.name,
+                "Type": cohort.type.value,
+                "Target": cohort.target_games,
+                # Show first 3 tags
+                "Tags": ", ".join(cohort.tags[:3]) + ("..." if len(cohort.tags) > 3 else ""),
+            }
+            for cohort in sorted(cohorts, key=lambda c: c.priority, reverse=True)
+        )
+        print(table.to_string(index=False))
 
     elif args.command == "process":
         if args.cohorts:
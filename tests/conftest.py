@@ -0,0 +1,10 @@
+"""Shared fixtures for the test suite"""
+
+import chess
+import pytest
+
+
+@pytest.fixture(scope="session")
+def start_board():
+    """Template starting board; tests copy it instead of re-running Board.__init__."""
+    return chess.Board()
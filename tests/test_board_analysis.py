@@ -35,18 +35,18 @@ class TestBoardAnalysis:
         assert start == chess.F7
         assert ahead == chess.F6
 
-    def test_is_pawn_exposed_starting_position(self):
+    def test_is_pawn_exposed_starting_position(self, start_board):
         """Test pawn exposure detection in starting position."""
-        board = chess.Board()
+        board = start_board
 
         # All pawns should be exposed initially
         for file_idx in range(8):
             assert is_pawn_exposed(board, file_idx, chess.WHITE)
             assert is_pawn_exposed(board, file_idx, chess.BLACK)
 
-    def test_is_pawn_exposed_after_moves(self):
+    def test_is_pawn_exposed_after_moves(self, start_board):
         """Test pawn exposure after some moves."""
-        board = chess.Board()
+        board = start_board.copy()
 
         # Move e2-e4
         board.push_san("e4")
@@ -61,9 +61,9 @@ class TestBoardAnalysis:
         for file_idx in range(8):
             assert is_pawn_exposed(board, file_idx, chess.BLACK)
 
-    def test_get_blocking_info_no_blocker(self):
+    def test_get_blocking_info_no_blocker(self, start_board):
         """Test blocking info when square is empty."""
-        board = chess.Board()
+        board = start_board.copy()
 
         # f3 is empty in starting position
         friendly_np, enemy, any_block, piece_type = get_blocking_info(board, 5, chess.WHITE)
@@ -73,9 +73,9 @@ class TestBoardAnalysis:
         assert not any_block
         assert piece_type is None
 
-    def test_get_blocking_info_friendly_piece(self):
+    def test_get_blocking_info_friendly_piece(self, start_board):
         """Test blocking info with friendly piece."""
-        board = chess.Board()
+        board = start_board.copy()
 
         # Place white knight on f3
         board.set_piece_at(chess.F3, chess.Piece(chess.KNIGHT, chess.WHITE))
@@ -87,9 +87,9 @@ class TestBoardAnalysis:
         assert any_block
         assert piece_type == chess.KNIGHT
 
-    def test_get_blocking_info_friendly_pawn(self):
+    def test_get_blocking_info_friendly_pawn(self, start_board):
         """Test blocking info with friendly pawn (should not count as friendly_np)."""
-        board = chess.Board()
+        board = start_board.copy()
 
         # Place white pawn on f3
         board.set_piece_at(chess.F3, chess.Piece(chess.PAWN, chess.WHITE))
@@ -101,9 +101,9 @@ class TestBoardAnalysis:
         assert any_block
         assert piece_type == chess.PAWN
 
-    def test_get_blocking_info_enemy_piece(self):
+    def test_get_blocking_info_enemy_piece(self, start_board):
         """Test blocking info with enemy piece."""
-        board = chess.Board()
+        board = start_board.copy()
 
         # Place black knight on f3
         board.set_piece_at(chess.F3, chess.Piece(chess.KNIGHT, chess.BLACK))
@@ -1,5 +1,6 @@
 """Test visualization functions."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -31,3 +32,10 @@ def test_create_delta_heatmap():
 
     assert fig is not None
     assert "Test Heatmap" in fig.layout.title.text
+
+    # Full 8x8 grid with data only on ranks 3 and 6; the other ranks are
+    # NaN so they render as background at unit brick height
+    z = np.asarray(fig.data[0].z, dtype=np.float64)
+    assert z.shape == (8, 8)
+    assert not np.isnan(z[[2, 5], :]).any()
+    assert np.isnan(np.delete(z, [2, 5], axis=0)).all()
@@ -3,6 +3,7 @@
 import chess
 import pytest
 
+from modules.core._pgn_cache import BoardSnapshot
 from modules.core.classification import (
     classify_f_bucket_for_color,
     classify_f_buckets_from_pgn,
@@ -12,11 +13,10 @@ from modules.core.classification import (
 class TestClassification:
     """Test f-file bucket classification."""
 
-    def test_classify_a1_bucket(self):
+    def test_classify_a1_bucket(self, start_board):
         """Test A1 classification (never moved, never blocked)."""
         # Single position: starting position
-        board = chess.Board()
-        positions = [board]
+        positions = [BoardSnapshot(start_board)]
 
         result = classify_f_bucket_for_color(positions, chess.WHITE)
         assert result == "A1"
@@ -24,14 +24,14 @@ class TestClassification:
         result = classify_f_bucket_for_color(positions, chess.BLACK)
         assert result == "A1"
 
-    def test_classify_a2_bucket(self):
+    def test_classify_a2_bucket(self, start_board):
         """Test A2 classification (moved one square, no prior block)."""
-        board = chess.Board()
-        positions = [board.copy()]
+        board = start_board.copy()
+        positions = [BoardSnapshot(board)]
 
         # Make f3 move
         board.push_san("f3")
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         result = classify_f_bucket_for_color(positions, chess.WHITE)
         assert result == "A2"
@@ -40,51 +40,51 @@ class TestClassification:
         result = classify_f_bucket_for_color(positions, chess.BLACK)
         assert result == "A1"
 
-    def test_classify_a3_bucket(self):
+    def test_classify_a3_bucket(self, start_board):
         """Test A3 classification (moved two squares, no prior block)."""
-        board = chess.Board()
-        positions = [board.copy()]
+        board = start_board.copy()
+        positions = [BoardSnapshot(board)]
 
         # Make f4 move
         board.push_san("f4")
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         result = classify_f_bucket_for_color(positions, chess.WHITE)
         assert result == "A3"
 
-    def test_classify_b4_bucket(self):
+    def test_classify_b4_bucket(self, start_board):
         """Test B4 classification (short blocking episode)."""
-        board = chess.Board()
-        positions = [board.copy()]
+        board = start_board.copy()
+        positions = [BoardSnapshot(board)]
 
         # Place knight on f3 (blocks f-pawn)
         board.push_san("Nf3")
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         # Black move, then remove knight quickly
         board.push_san("e6")  # Black move
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         board.push_san("Ng5")  # Move knight away
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         result = classify_f_bucket_for_color(positions, chess.WHITE)
         assert result == "B4"  # Short blocking episode (1-2 plies)
 
-    def test_classify_b5_bucket(self):
+    def test_classify_b5_bucket(self, start_board):
         """Test B5 classification (long blocking episode)."""
-        board = chess.Board()
-        positions = [board.copy()]
+        board = start_board.copy()
+        positions = [BoardSnapshot(board)]
 
         # Place knight on f3 and keep it there
         board.push_san("Nf3")
-        positions.append(board.copy())
+        positions.append(BoardSnapshot(board))
 
         # Make several other moves while knight stays (alternating colors)
         moves = ["e6", "e4", "Nf6", "d4"]
         for move in moves:
             board.push_san(move)
-            positions.append(board.copy())
+            positions.append(BoardSnapshot(board))
 
         result = classify_f_bucket_for_color(positions, chess.WHITE)
         assert result == "B5"  # Long blocking episode (>2 plies)
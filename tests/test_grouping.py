@@ -1,5 +1,6 @@
 """Tests for player classification and grouping"""
 
+import pandas as pd
 import pytest
 
 from modules.analysis.grouping import (
@@ -133,6 +134,31 @@ class TestPlayerClassifier:
 
         assert len(groups) == 3
 
+    def test_classify_games_matches_scalar(self):
+        """Batch classification agrees with per-game classification."""
+        classifier = (
+            PlayerClassifier()
+            .add_engine_rule("engine")
+            .add_rating_rule("strong", 2500)
+            .add_player_name_rule("leela", ["LeelaChessZero"])
+        )
+
+        games_df = pd.DataFrame(
+            {
+                "white_player": ["LeelaChessZero", "Alice", "Bob"],
+                "black_player": ["Human", "Bob", "Stockfish"],
+                "white_elo": [3200, 1600, None],
+                "black_elo": [2000, 1550, 3400],
+            }
+        )
+
+        result = classifier.classify_games(games_df)
+
+        assert list(result.columns) == ["engine", "strong", "leela"]
+        assert result["engine"].tolist() == [True, False, True]
+        assert result["strong"].tolist() == [True, False, True]
+        assert result["leela"].tolist() == [True, False, False]
+
 
 class TestGameFilter:
     """Test game filtering system."""